@@ -70,6 +70,7 @@ class Config:
             'enable_style_analysis': True,
             'enable_ai_enhancement': True,
             'enable_validation': True,
+            'parallel_parse': True,
             
             # Limits
             'max_file_size_mb': 10,
@@ -311,6 +312,7 @@ class Config:
 #enable_style_analysis=true
 #enable_ai_enhancement=true
 #enable_validation=true
+#parallel_parse=true
 
 # Limits
 #max_file_size_mb=10
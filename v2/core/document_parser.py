@@ -4,8 +4,11 @@ Supports PDF, DOCX, Markdown, and plain text files.
 """
 
 import os
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import logging
 
 try:
@@ -18,6 +21,16 @@ try:
 except ImportError:
     Document = None
 
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+try:
+    import mammoth
+except ImportError:
+    mammoth = None
+
 class DocumentParser:
     """Parser for extracting text content from various document formats."""
     
@@ -62,6 +75,79 @@ class DocumentParser:
         """
         return self.extract_text_from_file(file_path)
     
+    def parse_document_fast(self, file_path: str) -> str:
+        """
+        Parse a single document using native extractors when available.
+        
+        PDFs are read with PyMuPDF and DOCX files with mammoth, both of which
+        do the heavy lifting outside the Python interpreter. Other formats, or
+        a missing optional library, fall back to `parse_document`.
+        
+        Args:
+            file_path: Path to the document file
+            
+        Returns:
+            Extracted text content
+        """
+        suffix = Path(file_path).suffix.lower()
+        if suffix == ".pdf" and fitz is not None:
+            extract = self._extract_from_pdf_native
+        elif suffix == ".docx" and mammoth is not None:
+            extract = self._extract_from_docx_mammoth
+        else:
+            return self.parse_document(file_path)
+        
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        return extract(file_path)
+    
+    @staticmethod
+    def backend_signature() -> str:
+        """
+        Identify the PDF/DOCX extractors `parse_document_fast` will use.
+        
+        Callers that cache parsed text include this in their cache key, so
+        results are re-parsed after an optional backend is installed or removed.
+        
+        Returns:
+            Short backend identifier, e.g. "pymupdf-mammoth_raw"
+        """
+        pdf_backend = "pymupdf" if fitz is not None else ("pypdf2" if PdfReader is not None else "nopdf")
+        docx_backend = "mammoth_raw" if mammoth is not None else ("python_docx" if Document is not None else "nodocx")
+        return f"{pdf_backend}-{docx_backend}"
+    
+    def parse_documents_parallel(self, file_paths: List[str],
+                                 max_workers: Optional[int] = None) -> Dict[str, str]:
+        """
+        Parse multiple documents concurrently with a thread pool.
+        
+        PDF/DOCX extraction is dominated by file I/O and native code, so
+        threads overlap well. Unlike `parse_documents`, errors are raised
+        rather than swallowed, matching `parse_document`.
+        
+        Args:
+            file_paths: List of file paths to parse
+            max_workers: Maximum number of worker threads (default: CPU count)
+            
+        Returns:
+            Dictionary mapping file paths to extracted text, in input order
+        """
+        if len(file_paths) <= 1:
+            return {path: self.parse_document(path) for path in file_paths}
+        
+        workers = min(len(file_paths), max_workers or os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            contents = list(executor.map(self._parse_timed, file_paths))
+        
+        return dict(zip(file_paths, contents))
+    
+    def _parse_timed(self, file_path: str) -> str:
+        """Parse a single document and log how long it took."""
+        start = time.perf_counter()
+        content = self.parse_document(file_path)
+        self.logger.info("Parsed %s in %.2fs", file_path, time.perf_counter() - start)
+        return content
+    
     def debug_parse_document(self, file_path: str) -> str:
         """
         Parse document with detailed debug output and full content display.
@@ -200,6 +286,24 @@ class DocumentParser:
         except Exception as e:
             raise Exception(f"Error parsing DOCX: {str(e)}")
     
+    def _extract_from_pdf_native(self, file_path: str) -> str:
+        """Extract text from PDF file with PyMuPDF."""
+        try:
+            with fitz.open(file_path) as doc:
+                return "\n".join(page.get_text("text") for page in doc)
+        except Exception as e:
+            raise Exception(f"Error parsing PDF: {str(e)}")
+    
+    def _extract_from_docx_mammoth(self, file_path: str) -> str:
+        """Extract plain text from DOCX file with mammoth."""
+        try:
+            # Raw text skips images (which Markdown conversion would inline as
+            # base64 data URIs) and Markdown escaping
+            with open(file_path, 'rb') as docx_file:
+                return mammoth.extract_raw_text(docx_file).value
+        except Exception as e:
+            raise Exception(f"Error parsing DOCX: {str(e)}")
+    
     def _extract_from_text(self, file_path: str) -> str:
         """Extract text from markdown or plain text file."""
         try:
@@ -212,24 +316,52 @@ class DocumentParser:
         except Exception as e:
             raise Exception(f"Error reading text file: {str(e)}")
     
-    def validate_files(self, file_paths: List[str]) -> List[str]:
+    def stat_files(self, file_paths: List[str]) -> Dict[str, Optional[os.stat_result]]:
+        """
+        Stat each file exactly once.
+        
+        Args:
+            file_paths: List of file paths to stat
+            
+        Returns:
+            Dictionary mapping file paths to stat results (None if missing)
+        """
+        stats = {}
+        for file_path in file_paths:
+            try:
+                stats[file_path] = os.stat(file_path)
+            except OSError:
+                stats[file_path] = None
+        return stats
+    
+    def validate_files(self, file_paths: List[str],
+                       file_stats: Optional[Dict[str, Optional[os.stat_result]]] = None) -> List[str]:
         """
         Validate that all files exist and have supported formats.
         
         Args:
             file_paths: List of file paths to validate
+            file_stats: Optional pre-computed result of `stat_files`
             
         Returns:
             List of validation error messages (empty if all valid)
         """
+        if file_stats is None:
+            file_stats = self.stat_files(file_paths)
+        
         errors = []
         
         for file_path in file_paths:
-            if not os.path.exists(file_path):
+            st = file_stats.get(file_path)
+            if st is None:
                 errors.append(f"File not found: {file_path}")
                 continue
+            
+            if not stat.S_ISREG(st.st_mode):
+                errors.append(f"Not a regular file: {file_path}")
+                continue
                 
-            suffix = Path(file_path).suffix.lower()
+            suffix = os.path.splitext(file_path)[1].lower()
             if suffix not in self.SUPPORTED_FORMATS:
                 errors.append(f"Unsupported format {suffix}: {file_path}")
                 
@@ -9,6 +9,9 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+# {{variable}} placeholder pattern, compiled once and shared by all engines
+_VARIABLE_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+
 class TemplateEngine:
     """Template engine for processing resume templates with variable substitution."""
     
@@ -23,7 +26,7 @@ class TemplateEngine:
         self.logger = logging.getLogger(__name__)
         
         # Variable pattern for template substitution
-        self.variable_pattern = re.compile(r'\{\{(\w+)\}\}')
+        self.variable_pattern = _VARIABLE_PATTERN
         
     def load_template(self, template_name: str) -> str:
         """
@@ -63,15 +66,20 @@ class TemplateEngine:
             Processed template with variables substituted
         """
         try:
-            # Simple variable substitution
-            processed = template_content
+            # Substitute every placeholder in a single regex pass, collecting
+            # the ones without a value instead of rescanning afterwards
+            unresolved = []
+            
+            def substitute(match):
+                key = match.group(1)
+                if key in variables:
+                    return str(variables[key])
+                unresolved.append(key)
+                return match.group(0)
             
-            for key, value in variables.items():
-                placeholder = f"{{{{{key}}}}}"
-                processed = processed.replace(placeholder, str(value))
+            processed = self.variable_pattern.sub(substitute, template_content)
             
             # Log any unresolved variables
-            unresolved = self.variable_pattern.findall(processed)
             if unresolved:
                 self.logger.warning(f"Unresolved template variables: {unresolved}")
             
@@ -8,55 +8,114 @@ import sys
 import os
 from pathlib import Path
 
+# 环境检查通过后写入的标记文件，内容为 gradio 版本及核心目录的 mtime
+ENV_MARKER = ".easycv_env_ok"
+REQUIRED_DIRS = ("core", "utils", "web")
+
+
+def _env_fingerprint(current_dir):
+    """返回当前环境指纹；gradio 未安装或目录缺失时返回 None"""
+    try:
+        from importlib.metadata import version
+        parts = [version("gradio")]
+    except Exception:
+        return None
+    
+    for name in REQUIRED_DIRS:
+        try:
+            parts.append(str(os.stat(current_dir / name).st_mtime_ns))
+        except OSError:
+            return None
+    
+    return "\t".join(parts)
+
+
+def _env_marker_matches(marker, fingerprint):
+    """检查标记文件是否与当前环境指纹一致"""
+    if fingerprint is None:
+        return False
+    try:
+        return marker.read_text(encoding="utf-8") == fingerprint
+    except OSError:
+        return False
+
+
 def main():
     """Launch the Gradio interface"""
     # 确保在正确的目录中运行
     current_dir = Path(__file__).parent
-    os.chdir(current_dir)
+    try:
+        os.chdir(current_dir)
+    except OSError as e:
+        print(f"⚠️  无法切换到项目目录: {e}")
     
     # 添加当前目录到Python路径
     sys.path.insert(0, str(current_dir))
     
-    print("🚀 正在启动 EasyCV Web 界面...")
-    print(f"📁 当前工作目录: {current_dir}")
-    print("📝 请确保已设置 OPENAI_API_KEY 环境变量")
-    print("💾 正在检查依赖...")
+    # 横幅与 ✅ 状态行仅在交互式终端中输出（横幅合并为一次写入）；错误信息始终输出
+    interactive = sys.stdout.isatty()
+    if interactive:
+        sys.stdout.write("\n".join([
+            "🚀 正在启动 EasyCV Web 界面...",
+            f"📁 当前工作目录: {current_dir}",
+            "📝 请确保已设置 OPENAI_API_KEY 环境变量",
+            "💾 正在检查依赖...",
+        ]) + "\n")
     
-    # 检查基本依赖
-    try:
-        import gradio
-        print("✅ Gradio 已安装")
-    except ImportError:
-        print("❌ Gradio 未安装")
-        print("💡 请运行: pip install gradio>=4.0.0")
-        sys.exit(1)
+    marker = current_dir / ENV_MARKER
+    fingerprint = _env_fingerprint(current_dir)
     
-    # 检查核心目录
-    core_dir = current_dir / "core"
-    utils_dir = current_dir / "utils"
-    web_dir = current_dir / "web"
+    if _env_marker_matches(marker, fingerprint):
+        if interactive:
+            print("✅ 环境未变化，跳过依赖与目录检查")
+    else:
+        # 检查基本依赖
+        try:
+            import gradio
+            if interactive:
+                print("✅ Gradio 已安装")
+        except ImportError:
+            print("❌ Gradio 未安装")
+            print("💡 请运行: pip install gradio>=4.0.0")
+            sys.exit(1)
     
-    if not core_dir.exists():
-        print(f"❌ 核心目录不存在: {core_dir}")
-        sys.exit(1)
+        # 检查核心目录
+        core_dir = current_dir / "core"
+        utils_dir = current_dir / "utils"
+        web_dir = current_dir / "web"
     
-    if not utils_dir.exists():
-        print(f"❌ 工具目录不存在: {utils_dir}")
-        sys.exit(1)
+        if not core_dir.exists():
+            print(f"❌ 核心目录不存在: {core_dir}")
+            sys.exit(1)
+    
+        if not utils_dir.exists():
+            print(f"❌ 工具目录不存在: {utils_dir}")
+            sys.exit(1)
         
-    if not web_dir.exists():
-        print(f"❌ Web目录不存在: {web_dir}")
-        sys.exit(1)
+        if not web_dir.exists():
+            print(f"❌ Web目录不存在: {web_dir}")
+            sys.exit(1)
     
-    print("✅ 目录结构检查通过")
+        if interactive:
+            print("✅ 目录结构检查通过")
+        
+        # 记录本次通过的检查结果，供下次启动复用
+        if fingerprint is not None:
+            try:
+                marker.write_text(fingerprint, encoding="utf-8")
+            except OSError:
+                pass
     
     try:
         # 尝试导入Gradio应用
         from web.gradio_app import EasyCVGradioApp
         
-        print("🌐 界面将在浏览器中自动打开")
-        print("⏹️  按 Ctrl+C 停止服务器")
-        print("-" * 50)
+        if interactive:
+            sys.stdout.write("\n".join([
+                "🌐 界面将在浏览器中自动打开",
+                "⏹️  按 Ctrl+C 停止服务器",
+                "-" * 50,
+            ]) + "\n")
         
         app = EasyCVGradioApp()
         
@@ -8,9 +8,6 @@ EasyCV 超级简化版本启动器
 import os
 import sys
 import argparse
-import webbrowser
-import traceback
-from pathlib import Path
 
 def main():
     parser = argparse.ArgumentParser(description="启动 EasyCV 超级简化版")
@@ -45,6 +42,7 @@ def main():
         print(f"❌ 导入错误: {e}")
         print("💡 请确保所有依赖都已安装: pip install -r requirements.txt")
     except Exception as e:
+        import traceback
         print(f"❌ 启动失败: {e}")
         print(f"🔍 详细错误信息:")
         print(traceback.format_exc())
@@ -3,35 +3,74 @@
 EasyCV 简化版启动器 - 确保Python 3.8兼容性
 """
 
-import gradio as gr
+import io
 import os
+import re
+import shutil
 import sys
-import tempfile
+import time
 from pathlib import Path
-from datetime import datetime
+
+# 可直接读取为文本的文件类型及大小上限
+TEXT_SUFFIXES = {'.txt', '.md'}
+MAX_TEXT_FILE_BYTES = 10 * 1024 * 1024
+
+# 文件名中不允许的字符；\w 包含 Unicode 字母，可保留中文姓名
+_SAFE_NAME_RE = re.compile(r'[^\w._ -]+')
+# 纯 ASCII 名称走 str.translate 快速路径，删除与上述正则等价的字符集
+_ASCII_UNSAFE_TABLE = dict.fromkeys(
+    (c for c in range(128) if not (chr(c).isalnum() or chr(c) in "._- ")), None
+)
+
+
+def _safe_filename(name):
+    """去除文件名中的不安全字符"""
+    if name.isascii():
+        return name.translate(_ASCII_UNSAFE_TABLE)
+    return _SAFE_NAME_RE.sub('', name)
+
+# 档案列表缓存（秒），避免连续点击刷新时重复扫描目录
+PROFILE_LIST_TTL = 2.0
+_profiles_cache = {'time': 0.0, 'text': None}
 
 def process_files(files):
     """简单的文件处理"""
     if not files:
         return "❌ 请上传文件", ""
     
-    content_list = []
+    buf = io.StringIO()
+    count = 0
     for file in files:
         if file is None:
             continue
+        if count:
+            buf.write("\n\n")
+        count += 1
+        start = buf.tell()
         try:
             file_path = Path(file.name)
-            if file_path.suffix.lower() in ['.txt', '.md']:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                content_list.append(f"=== {file_path.name} ===\n{content}")
-            else:
-                content_list.append(f"=== {file_path.name} ===\n文件类型: {file_path.suffix}")
+            suffix = file_path.suffix.lower()
+            if suffix not in TEXT_SUFFIXES:
+                buf.writelines(("=== ", file_path.name, " ===\n文件类型: ", file_path.suffix))
+                continue
+            
+            size = os.stat(file_path).st_size
+            if size > MAX_TEXT_FILE_BYTES:
+                buf.writelines(("=== ", file_path.name, " ===\n文件过大: ", f"{size / 1024 / 1024:.1f}MB"))
+                continue
+            
+            # 分块流式写入缓冲区，不再先整体读入内存
+            buf.writelines(("=== ", file_path.name, " ===\n"))
+            with open(file_path, 'r', encoding='utf-8') as f:
+                shutil.copyfileobj(f, buf)
         except Exception as e:
-            content_list.append(f"=== 文件错误 ===\n{str(e)}")
+            # 读取失败时回退到本文件开头，不留下半截内容
+            buf.seek(start)
+            buf.truncate()
+            buf.writelines(("=== 文件错误 ===\n", str(e)))
     
-    if content_list:
-        return f"✅ 处理了 {len(content_list)} 个文件", "\n\n".join(content_list)
+    if count:
+        return f"✅ 处理了 {count} 个文件", buf.getvalue()
     else:
         return "❌ 无法处理文件", ""
 
@@ -40,9 +79,11 @@ def generate_resume(name, job_desc, content, template):
     if not name or not job_desc or not content:
         return "❌ 请填写所有必要信息", None
     
+    from datetime import datetime
+    
     try:
         # 创建安全的文件名
-        safe_name = "".join(c for c in name if c.isalnum() or c in "._- ")
+        safe_name = _safe_filename(name)
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
         # 创建输出目录
@@ -74,28 +115,45 @@ def generate_resume(name, job_desc, content, template):
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write(resume_content)
         
+        # 新档案已写入，使档案列表缓存失效
+        _profiles_cache['text'] = None
+        
         return f"✅ 简历已生成: {file_path}", str(file_path)
         
     except Exception as e:
         return f"❌ 生成失败: {str(e)}", None
 
+def _count_markdown_files(path):
+    """统计目录下的 Markdown 文件数"""
+    with os.scandir(path) as it:
+        return sum(1 for e in it if e.name.endswith('.md') and e.is_file(follow_symlinks=False))
+
 def list_profiles():
     """列出现有档案"""
-    profiles_dir = Path("profiles")
-    if not profiles_dir.exists():
-        return "📁 暂无档案"
+    now = time.monotonic()
+    if _profiles_cache['text'] is not None and now - _profiles_cache['time'] < PROFILE_LIST_TTL:
+        return _profiles_cache['text']
     
     profiles = []
-    for item in profiles_dir.iterdir():
-        if item.is_dir():
-            files = list(item.glob("*.md"))
-            if files:
-                profiles.append(f"📋 {item.name}: {len(files)} 个文件")
+    try:
+        with os.scandir("profiles") as it:
+            for entry in it:
+                if entry.is_dir():
+                    count = _count_markdown_files(entry.path)
+                    if count:
+                        profiles.append(f"📋 {entry.name}: {count} 个文件")
+    except FileNotFoundError:
+        pass
     
-    return "\n".join(profiles) if profiles else "📁 暂无档案"
+    text = "\n".join(profiles) if profiles else "📁 暂无档案"
+    _profiles_cache['time'] = now
+    _profiles_cache['text'] = text
+    return text
 
 # 创建Gradio界面
 def create_app():
+    import gradio as gr
+    
     with gr.Blocks(title="EasyCV 简历生成器") as app:
         gr.Markdown("# 🚀 EasyCV 简历生成器（兼容版）")
         
@@ -158,7 +216,14 @@ def main():
     print(f"工作目录: {Path.cwd()}")
     
     try:
+        # 界面只构建一次，备用方案仅更换启动参数
         app = create_app()
+    except Exception as e:
+        print(f"❌ 界面创建失败: {e}")
+        _print_manual_hints()
+        return
+    
+    try:
         app.launch(
             server_name="127.0.0.1",
             server_port=7860,
@@ -171,7 +236,6 @@ def main():
         # 尝试备用方案
         try:
             print("🔄 尝试备用配置...")
-            app = create_app()
             app.launch(
                 server_name="0.0.0.0",
                 server_port=7860,
@@ -181,9 +245,13 @@ def main():
             )
         except Exception as e2:
             print(f"❌ 备用方案也失败: {e2}")
-            print("\n💡 手动启动建议:")
-            print("1. 尝试安装较旧版本的Gradio: pip install gradio==3.50.0")
-            print("2. 或者使用命令行版本: python main.py generate --help")
+            _print_manual_hints()
+
+def _print_manual_hints():
+    """打印手动启动建议"""
+    print("\n💡 手动启动建议:")
+    print("1. 尝试安装较旧版本的Gradio: pip install gradio==3.50.0")
+    print("2. 或者使用命令行版本: python main.py generate --help")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -6,6 +6,7 @@ import os
 import sys
 import argparse
 import logging
+import threading
 from pathlib import Path
 from typing import List, Optional
 
@@ -13,14 +14,25 @@ from typing import List, Optional
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config import config
-from core import DocumentParser, AIProcessor, TemplateEngine, OutputGenerator
-from utils import FileUtils
+
+# Set once the root logger has been configured, so later EasyCVApp
+# instances (e.g. one per web session) don't reopen the log file
+_logging_configured = False
 
 class EasyCVApp:
     """Main application class for EasyCV."""
     
+    # AI processors shared across app instances, keyed by (api_key, model),
+    # so each process builds one OpenAI client per credential set
+    _ai_singletons = {}
+    _ai_singletons_lock = threading.Lock()
+    
     def __init__(self):
         """Initialize the application."""
+        # Imported here so `create_parser` / `--help` stay cheap
+        from core import DocumentParser, TemplateEngine, OutputGenerator
+        from utils import FileUtils
+        
         self.setup_logging()
         self.logger = logging.getLogger(__name__)
         
@@ -34,29 +46,43 @@ class EasyCVApp:
         self.ai_processor = None
     
     def setup_logging(self):
-        """Setup logging configuration."""
+        """Setup logging configuration (once per process)."""
+        global _logging_configured
+        if _logging_configured:
+            return
+        
         log_level = getattr(logging, config.get('log_level', 'INFO').upper())
         log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        log_file = config.get('log_file')
         
         logging.basicConfig(
             level=log_level,
             format=log_format,
             handlers=[
                 logging.StreamHandler(sys.stdout),
-                *([logging.FileHandler(config.get('log_file'))] if config.get('log_file') else [])
+                *([logging.FileHandler(log_file)] if log_file else [])
             ]
         )
+        _logging_configured = True
     
     def initialize_ai_processor(self):
         """Initialize AI processor if not already done."""
         if self.ai_processor is None:
+            from core import AIProcessor
+            
             try:
                 ai_config = config.get_ai_config()
                 if ai_config['api_key']:
-                    self.ai_processor = AIProcessor(
-                        api_key=ai_config['api_key'],
-                        model=ai_config['model']
-                    )
+                    key = (ai_config['api_key'], ai_config['model'])
+                    with self._ai_singletons_lock:
+                        processor = self._ai_singletons.get(key)
+                        if processor is None:
+                            processor = AIProcessor(
+                                api_key=ai_config['api_key'],
+                                model=ai_config['model']
+                            )
+                            self._ai_singletons[key] = processor
+                    self.ai_processor = processor
                     self.logger.info("AI processor initialized successfully")
                 else:
                     raise ValueError("OpenAI API key not configured")
@@ -87,10 +113,13 @@ class EasyCVApp:
         
         # Load documents
         self.logger.info(f"Loading {len(documents)} documents...")
-        documents_text = {}
-        for doc_path in documents:
-            content = self.document_parser.parse_document(doc_path)
-            documents_text[doc_path] = content
+        if config.get('parallel_parse', True):
+            documents_text = self.document_parser.parse_documents_parallel(documents)
+        else:
+            documents_text = {}
+            for doc_path in documents:
+                content = self.document_parser.parse_document(doc_path)
+                documents_text[doc_path] = content
             
         # Load job description
         jd_text = self._load_job_description(job_description)
@@ -226,25 +255,31 @@ class EasyCVApp:
     
     def _validate_inputs(self, documents: List[str], template_path: str):
         """Validate input files."""
+        # Snapshot limits once so the checks below are plain local comparisons
+        max_size = config.get('max_file_size_mb', 10) * 1024 * 1024
+        max_batch = config.get('max_files_per_batch', 20)
+        
+        # Check batch size
+        if len(documents) > max_batch:
+            raise ValueError(f"Too many files. Maximum: {max_batch}")
+        
+        # Stat every document once and reuse it for existence and size checks
+        file_stats = self.document_parser.stat_files(documents)
+        
         # Validate documents
-        errors = self.document_parser.validate_files(documents)
+        errors = self.document_parser.validate_files(documents, file_stats)
         if errors:
             raise ValueError(f"Document validation errors: {'; '.join(errors)}")
         
         # Validate template
-        if not Path(template_path).exists():
+        if not os.path.isfile(template_path):
             raise FileNotFoundError(f"Template not found: {template_path}")
         
         # Check file sizes
-        max_size = config.get('max_file_size_mb', 10) * 1024 * 1024
         for doc_path in documents:
-            size = Path(doc_path).stat().st_size
+            size = file_stats[doc_path].st_size
             if size > max_size:
                 raise ValueError(f"File too large: {doc_path} ({size / 1024 / 1024:.1f}MB)")
-        
-        # Check batch size
-        if len(documents) > config.get('max_files_per_batch', 20):
-            raise ValueError(f"Too many files. Maximum: {config.get('max_files_per_batch')}")
     
     def _load_job_description(self, job_description: str) -> str:
         """Load job description from text or file."""
@@ -315,6 +350,28 @@ Examples:
     
     return parser
 
+def handle_config_command(args: argparse.Namespace):
+    """Handle the `config` command using only the settings module."""
+    if args.validate:
+        validation = config.validate()
+        if validation['valid']:
+            print("Configuration is valid.")
+        else:
+            print("Configuration issues found:")
+            for error in validation['errors']:
+                print(f"  ERROR: {error}")
+        for warning in validation['warnings']:
+            print(f"  WARNING: {warning}")
+            
+    elif args.sample:
+        config.create_sample_config(args.sample)
+        print(f"Sample configuration created: {args.sample}")
+        
+    elif args.show:
+        print("Current configuration:")
+        for key in sorted(config.settings):
+            print(f"  {key}: {config.settings[key]}")
+
 def main():
     """Main entry point."""
     parser = create_parser()
@@ -333,6 +390,11 @@ def main():
         if args.log_level:
             config.set('log_level', args.log_level)
         
+        # Config command only needs the settings, not the full app stack
+        if args.command == 'config':
+            handle_config_command(args)
+            return
+        
         # Initialize app
         app = EasyCVApp()
         
@@ -377,27 +439,6 @@ def main():
             removed = app.cleanup_old_versions(args.profile, args.keep)
             print(f"Removed {len(removed)} old versions: {', '.join(removed)}")
             
-        elif args.command == 'config':
-            if args.validate:
-                validation = config.validate()
-                if validation['valid']:
-                    print("Configuration is valid.")
-                else:
-                    print("Configuration issues found:")
-                    for error in validation['errors']:
-                        print(f"  ERROR: {error}")
-                for warning in validation['warnings']:
-                    print(f"  WARNING: {warning}")
-                    
-            elif args.sample:
-                config.create_sample_config(args.sample)
-                print(f"Sample configuration created: {args.sample}")
-                
-            elif args.show:
-                print("Current configuration:")
-                for key, value in sorted(config.settings.items()):
-                    print(f"  {key}: {value}")
-                    
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
         sys.exit(1)
@@ -5,16 +5,27 @@ Handles module imports and provides a clean entry point
 """
 
 import sys
-import os
 from pathlib import Path
 
 # Add the project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+
+def _is_help_request(argv) -> bool:
+    """Return True when the command line only asks for usage information."""
+    return len(argv) <= 1 or argv[1] in ('-h', '--help')
+
+
 # Import and run main function
 if __name__ == "__main__":
     try:
+        if _is_help_request(sys.argv):
+            # Fast path: build the parser without loading the core/AI stack
+            from main import create_parser
+            create_parser().print_help()
+            sys.exit(0)
+        
         from main import main
         main()
     except ImportError as e:
@@ -24,4 +35,4 @@ if __name__ == "__main__":
         sys.exit(1)
     except Exception as e:
         print(f"Error: {e}")
-        sys.exit(1) 
\ No newline at end of file
+        sys.exit(1)
@@ -1,3 +1,5 @@
+import re
+
 from docx import Document
 
 # 加载原始 Wonsulting 模板
@@ -25,14 +27,21 @@ replacements = {
     "Achievements: What are you interested in getting into + what do you like to do outside of work/for fun?": "Achievements: {{ achievements }}"
 }
 
-# 替换段落内容
-for para in doc.paragraphs:
-    for key, val in replacements.items():
-        if key in para.text:
-            inline = para.runs
-            for i in range(len(inline)):
-                if key in inline[i].text:
-                    inline[i].text = inline[i].text.replace(key, val)
+# 仅保留文档中实际出现、且替换后会变化的键
+doc_text = "\n".join(p.text for p in doc.paragraphs)
+present = {k: v for k, v in replacements.items() if k != v and k in doc_text}
+
+if present:
+    # 构建一次多模式正则：长键优先，避免 "Skills: ..." 被其子串抢先匹配
+    pattern = re.compile("|".join(map(re.escape, sorted(present, key=len, reverse=True))))
+
+    # 替换段落内容（无命中的段落直接跳过，命中的每个 run 只扫描一次）
+    for para in doc.paragraphs:
+        if not pattern.search(para.text):
+            continue
+        for run in para.runs:
+            if run.text:
+                run.text = pattern.sub(lambda m: present[m.group(0)], run.text)
 
 # 保存修改后的文档
 output_path = "/Users/zhangyaxuan/Projects/EasyCV/v2/templates/resume_docx_templates/clean_resume_template.docx"
@@ -1,60 +1,167 @@
 # Re-run necessary imports and code due to state reset
-from docx import Document
-from docx.shared import Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+import zipfile
+from functools import lru_cache
 from pathlib import Path
+from xml.sax.saxutils import escape
+
+from template_helpers import is_up_to_date
 
 # Define directory for DOCX templates
 docx_template_dir = Path("templates/resume_docx")
-docx_template_dir.mkdir(parents=True, exist_ok=True)
 
-def create_docx_template(filename: str, style: str = "classic") -> Path:
-    doc = Document()
+# 直接写 OOXML 所需的固定部件（不依赖 python-docx）
+CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '<Override PartName="/word/numbering.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.numbering+xml"/>'
+    '</Types>'
+)
+
+ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+DOCUMENT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/numbering" Target="numbering.xml"/>'
+    '</Relationships>'
+)
+
+# 仅定义模板用到的样式：Title / Heading1 / ListBullet（带项目符号编号）
+STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:styles xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/>'
+    '<w:rPr><w:sz w:val="22"/></w:rPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Title"><w:name w:val="Title"/><w:basedOn w:val="Normal"/>'
+    '<w:rPr><w:sz w:val="56"/></w:rPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/><w:basedOn w:val="Normal"/>'
+    '<w:pPr><w:keepNext/><w:spacing w:before="480"/><w:outlineLvl w:val="0"/></w:pPr>'
+    '<w:rPr><w:b/><w:sz w:val="28"/></w:rPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="ListBullet"><w:name w:val="List Bullet"/><w:basedOn w:val="Normal"/>'
+    '<w:pPr><w:numPr><w:numId w:val="1"/></w:numPr><w:ind w:left="360" w:hanging="360"/></w:pPr></w:style>'
+    '</w:styles>'
+)
+
+# ListBullet 引用的项目符号编号定义（numId 1 -> 圆点符号）
+NUMBERING_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:numbering xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:abstractNum w:abstractNumId="0"><w:multiLevelType w:val="singleLevel"/>'
+    '<w:lvl w:ilvl="0"><w:start w:val="1"/><w:numFmt w:val="bullet"/><w:lvlText w:val="•"/>'
+    '<w:lvlJc w:val="left"/><w:pPr><w:ind w:left="360" w:hanging="360"/></w:pPr></w:lvl>'
+    '</w:abstractNum>'
+    '<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>'
+    '</w:numbering>'
+)
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def _paragraph_xml(text: str, style: str = None, align: str = None, size_pt: int = None) -> str:
+    """生成单个段落的 <w:p> XML"""
+    ppr = ""
+    if style or align:
+        ppr = "<w:pPr>"
+        if style:
+            ppr += f'<w:pStyle w:val="{style}"/>'
+        if align:
+            ppr += f'<w:jc w:val="{align}"/>'
+        ppr += "</w:pPr>"
+    rpr = f'<w:rPr><w:sz w:val="{size_pt * 2}"/></w:rPr>' if size_pt else ""
+    # 与 python-docx 一致：文本中的换行写成 <w:br/>，Word 不会渲染 <w:t> 里的 "\n"
+    pieces = [f'<w:t xml:space="preserve">{escape(piece)}</w:t>' if piece else "" for piece in text.split("\n")]
+    run = f'<w:r>{rpr}{"<w:br/>".join(pieces)}</w:r>' if text else ""
+    return f"<w:p>{ppr}{run}</w:p>"
+
 
+def build_document_xml(blocks) -> bytes:
+    """将 (text, style, align, size_pt) 段落列表一次性拼成 word/document.xml"""
+    body = "".join(_paragraph_xml(*block) for block in blocks)
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:document xmlns:w="{W_NS}"><w:body>{body}<w:sectPr/></w:body></w:document>'
+    ).encode("utf-8")
+
+
+# 模板段落定义：(text, style, align, size_pt)，与样式参数无关，可在各文件间共用
+TEMPLATE_BLOCKS = (
     # Title
-    title = doc.add_heading("{{ name }}", level=0)
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    ("{{ name }}", "Title", "center", None),
 
     # Contact Info
-    para = doc.add_paragraph()
-    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = para.add_run("{{ location }} · {{ email }} · {{ phone }} · {{ linkedin }}")
-    run.font.size = Pt(10)
+    ("{{ location }} · {{ email }} · {{ phone }} · {{ linkedin }}", None, "center", 10),
 
-    doc.add_paragraph("\n")
+    ("\n", None, None, None),
 
     # Summary
-    doc.add_heading("Summary", level=1)
-    doc.add_paragraph("{{ summary }}")
+    ("Summary", "Heading1", None, None),
+    ("{{ summary }}", None, None, None),
 
     # Experience
-    doc.add_heading("Experience", level=1)
-    doc.add_paragraph("{% for exp in experiences %}")
-    doc.add_paragraph("{{ exp.title }} at {{ exp.organization }} ({{ exp.time }})", style="List Bullet")
-    doc.add_paragraph("{% for line in exp.content.split('\\n') %}- {{ line }}{% endfor %}", style="Normal")
-    doc.add_paragraph("{% endfor %}")
+    ("Experience", "Heading1", None, None),
+    ("{% for exp in experiences %}", None, None, None),
+    ("{{ exp.title }} at {{ exp.organization }} ({{ exp.time }})", "ListBullet", None, None),
+    # 每行经历单独成段，渲染后各行不会挤在同一段里
+    ("{% for line in exp.content.split('\\n') %}", None, None, None),
+    ("- {{ line }}", None, None, None),
+    ("{% endfor %}", None, None, None),
+    ("{% endfor %}", None, None, None),
 
     # Education
-    doc.add_heading("Education", level=1)
-    doc.add_paragraph("{% for edu in education %}")
-    doc.add_paragraph("{{ edu.degree }} at {{ edu.school }} ({{ edu.time }})", style="List Bullet")
-    doc.add_paragraph("{{ edu.content }}", style="Normal")
-    doc.add_paragraph("{% endfor %}")
+    ("Education", "Heading1", None, None),
+    ("{% for edu in education %}", None, None, None),
+    ("{{ edu.degree }} at {{ edu.school }} ({{ edu.time }})", "ListBullet", None, None),
+    ("{{ edu.content }}", None, None, None),
+    ("{% endfor %}", None, None, None),
 
     # Skills
-    doc.add_heading("Skills", level=1)
-    doc.add_paragraph("{% for skill in skills %}• {{ skill.skill }} ({{ skill.degree }}){% endfor %}")
+    ("Skills", "Heading1", None, None),
+    ("{% for skill in skills %}• {{ skill.skill }} ({{ skill.degree }}){% endfor %}", None, None, None),
 
     # Achievements
-    doc.add_heading("Achievements", level=1)
-    doc.add_paragraph("{% for ach in achievements %}• {{ ach }}{% endfor %}")
+    ("Achievements", "Heading1", None, None),
+    ("{% for ach in achievements %}• {{ ach }}{% endfor %}", None, None, None),
+)
+
+
+@lru_cache(maxsize=None)
+def _template_document_xml() -> bytes:
+    """模板正文只构建一次，之后每个 DOCX 直接写入同一份字节"""
+    return build_document_xml(TEMPLATE_BLOCKS)
+
 
+def create_docx_template(filename: str, style: str = "classic") -> Path:
     path = docx_template_dir / filename
-    doc.save(path)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", CONTENT_TYPES_XML)
+        zf.writestr("_rels/.rels", ROOT_RELS_XML)
+        zf.writestr("word/_rels/document.xml.rels", DOCUMENT_RELS_XML)
+        zf.writestr("word/styles.xml", STYLES_XML)
+        zf.writestr("word/numbering.xml", NUMBERING_XML)
+        zf.writestr("word/document.xml", _template_document_xml())
     return path
 
-# Create two templates with different intended styles
-template1 = create_docx_template("classic_template.docx", style="classic")
-template2 = create_docx_template("modern_template.docx", style="modern")
 
-[template1.name, template2.name]
+def main():
+    docx_template_dir.mkdir(parents=True, exist_ok=True)
+
+    # Create two templates with different intended styles
+    for filename, style in (("classic_template.docx", "classic"), ("modern_template.docx", "modern")):
+        if is_up_to_date(docx_template_dir / filename, __file__):
+            print(f"[=] Up to date: {filename}")
+            continue
+        print(f"[✔] Created: {create_docx_template(filename, style=style).name}")
+
+
+if __name__ == "__main__":
+    main()
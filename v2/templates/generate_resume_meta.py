@@ -1,8 +1,22 @@
 # Re-import necessary modules due to state reset
 import json
 import yaml
+from functools import lru_cache
 from pathlib import Path
 
+from template_helpers import is_up_to_date
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 优先使用 libyaml 的 C 实现，缺失时回退到纯 Python 版本
+try:
+    from yaml import CDumper as YamlDumper
+except ImportError:
+    from yaml import Dumper as YamlDumper
+
 # UK Quantitative Analyst resume content
 quant_resume = {
     "name": "James Carter",
@@ -76,28 +90,32 @@ quant_resume = {
 }
 
 
-def render_markdown_header(data):
-    name = data.get("name", "").upper()
-    contact = f"{data.get('email', '')} | {data.get('location', '')} | {data.get('phone', '')} | {data.get('linkedin', '')}"
+@lru_cache(maxsize=128)
+def _render_markdown_header_cached(name, email, location, phone, linkedin):
+    # Keyed on the plain string fields, so repeated renders of one profile reuse the result
     return (
         f'<p align="center" style="line-height: 1.2; margin: 0;">'
-        f'<strong style="font-size: 2em;">{name}</strong><br>'
-        f'<small>{contact}</small>'
+        f'<strong style="font-size: 2em;">{name.upper()}</strong><br>'
+        f'<small>{email} | {location} | {phone} | {linkedin}</small>'
         f'</p>'
     )
 
 
-def render_skills_table_3col(skills):
-    def format_cell(skill):
-        return f"{skill['skill']} ({skill['degree']})"
+def render_markdown_header(data):
+    return _render_markdown_header_cached(
+        data.get("name", ""),
+        data.get("email", ""),
+        data.get("location", ""),
+        data.get("phone", ""),
+        data.get("linkedin", ""),
+    )
+
 
-    rows = []
-    for i in range(0, len(skills), 3):
-        row = skills[i:i+3]
-        cells = [format_cell(s) for s in row]
-        while len(cells) < 3:
-            cells.append("")  # pad if not divisible by 3
-        rows.append("\t\t".join(cells))
+def render_skills_table_3col(skills):
+    # One comprehension formats every cell; right-pad to a multiple of 3 up front
+    cells = [f"{s['skill']} ({s['degree']})" for s in skills]
+    cells += [""] * (-len(cells) % 3)
+    rows = ["\t\t".join(cells[i:i + 3]) for i in range(0, len(cells), 3)]
 
     # header = "| Skill | Skill | Skill |"
     # divider = "|-------|-------|-------|"
@@ -106,54 +124,79 @@ def render_skills_table_3col(skills):
     return "\n".join(rows)
 
 
+# Section keys and their Markdown headings, in output order
+SECTION_KEYS = ("experiences", "education", "skills", "achievements")
+SECTION_HEADINGS = ("## Work Experience", "## Education", "## Skills", "## Achievements")
+
+
 def render_markdown_body(data):
     lines = [render_markdown_header(data), ""]
     # lines = [f"# {data['name']}", f'<p align="center"><sub> {data["email"]} | {data["phone"]} | {data["location"]} | {data["linkedin"]}</sub></p>', ""] 
     # lines += [f'<p align="center"><sub> {data["email"]} | {data["phone"]} | {data["location"]} | {data["linkedin"]}</sub></p>', ""]
-    lines += [f"## Summary", data["summary"], ""]
-
-    if "experiences" in data:
-        lines.append("## Work Experience")
-        for exp in data["experiences"]:
-            lines.append(f"**{exp['title']}**, {exp['organization']} ({exp['time']})")
-            lines.append(exp["content"])
-            lines.append("")
-
-    if "education" in data:
-        lines.append("## Education")
-        for edu in data["education"]:
-            lines.append(f"**{edu['degree']}**, {edu['school']} ({edu['time']})")
-            lines.append(edu["content"])
-            lines.append("")
-
-    if "skills" in data:
-        lines.append("## Skills")
-        lines.append(render_skills_table_3col(data["skills"]))
-        lines.append("")
+    lines.extend(("## Summary", data["summary"], ""))
+
+    # Look every optional section up once; None means the key is absent
+    experiences, education, skills, achievements = (data.get(k) for k in SECTION_KEYS)
+    experience_heading, education_heading, skills_heading, achievements_heading = SECTION_HEADINGS
+
+    if experiences is not None:
+        lines.append(experience_heading)
+        for exp in experiences:
+            lines.extend((
+                f"**{exp['title']}**, {exp['organization']} ({exp['time']})",
+                exp["content"],
+                "",
+            ))
+
+    if education is not None:
+        lines.append(education_heading)
+        for edu in education:
+            lines.extend((
+                f"**{edu['degree']}**, {edu['school']} ({edu['time']})",
+                edu["content"],
+                "",
+            ))
+
+    if skills is not None:
+        lines.extend((skills_heading, render_skills_table_3col(skills), ""))
 
         # for s in data["skills"]:
         #     lines.append(f"- {s['skill']} ({s['degree']})")
         # lines.append("")
 
-    if "achievements" in data:
-        lines.append("## Achievements")
-        for a in data["achievements"]:
-            lines.append(f"- {a}")
+    if achievements is not None:
+        lines.append(achievements_heading)
+        lines.extend(f"- {a}" for a in achievements)
         lines.append("")
 
     return "\n".join(lines)
 
-# Save JSON and Markdown+YAML
-Path("structured_templates").mkdir(exist_ok=True)
+JSON_OUTPUT_PATH = Path("/Users/zhangyaxuan/Projects/EasyCV/v2/templates/sample_template_uk_quant.json")
+MD_OUTPUT_PATH = Path("/Users/zhangyaxuan/Projects/EasyCV/v2/templates/sample_template_uk_quant.md")
+
+
+def main():
+    # Save JSON and Markdown+YAML
+    Path("structured_templates").mkdir(exist_ok=True)
+
+    if is_up_to_date(JSON_OUTPUT_PATH, __file__) and is_up_to_date(MD_OUTPUT_PATH, __file__):
+        print("[=] Up to date: sample_template_uk_quant.{json,md}")
+        return
+
+    if orjson is not None:
+        # orjson serialises straight to UTF-8 bytes; one write_bytes call
+        JSON_OUTPUT_PATH.write_bytes(orjson.dumps(quant_resume, option=orjson.OPT_INDENT_2))
+    else:
+        with open(JSON_OUTPUT_PATH, "w", encoding="utf-8") as f:
+            json.dump(quant_resume, f, indent=2, ensure_ascii=False)
 
-with open("/Users/zhangyaxuan/Projects/EasyCV/v2/templates/sample_template_uk_quant.json", "w", encoding="utf-8") as f:
-    json.dump(quant_resume, f, indent=2)
+    yaml_text_quant = yaml.dump(quant_resume, Dumper=YamlDumper, sort_keys=False, allow_unicode=True)
+    markdown_body = render_markdown_body(quant_resume)
+    md_output_quant = f"---\n{yaml_text_quant}---\n\n{markdown_body}"
 
-yaml_text_quant = yaml.dump(quant_resume, sort_keys=False, allow_unicode=True)
-markdown_body = render_markdown_body(quant_resume)
-md_output_quant = f"---\n{yaml_text_quant}---\n\n{markdown_body}"
+    with open(MD_OUTPUT_PATH, "w", encoding="utf-8") as f:
+        f.write(md_output_quant)
 
-with open("/Users/zhangyaxuan/Projects/EasyCV/v2/templates/sample_template_uk_quant.md", "w", encoding="utf-8") as f:
-    f.write(md_output_quant)
 
-md_output_quant[:1000]  # Preview
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,120 @@
 # Recreate the template directory after kernel reset
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+
+from template_helpers import is_up_to_date
 template_dir = Path("v2/templates/resume_html_templates")
-template_dir.mkdir(parents=True, exist_ok=True)
 
-# Clean and compact HTML resume template variants
-templates = {
-    "clean_compact_1.html": """
-<!DOCTYPE html>
+# 公共基础模板：各变体通过 {% extends %} 复用，仅覆盖样式、页眉及（必要时）正文区块。
+# 默认正文区块采用“公司突出 + 时间靠右”的紧凑布局。
+base_template = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
-    <title>{{ name }} - Resume</title>
+    <title>{% block title %}{{ name }}{% endblock %}</title>
     <style>
+{% block styles %}{% endblock %}
+    </style>
+</head>
+<body>
+{% block header %}{% endblock %}
+{% block sections %}
+    <div class="section">
+        <h2>Summary</h2>
+        <p>{{ summary }}</p>
+    </div>
+
+    <div class="section">
+        <h2>Experience</h2>
+        {% for exp in experiences %}
+        <div class="header-line">
+            <div>{{ exp.title }}, <strong>{{ exp.organization }}</strong></div>
+            <div>{{ exp.time }}</div>
+        </div>
+        <ul class="subpoints">
+            {% for line in exp.content.split('\\n') %}
+            <li>{{ line }}</li>
+            {% endfor %}
+        </ul>
+        {% endfor %}
+    </div>
+
+    <div class="section">
+        <h2>Education</h2>
+        {% for edu in education %}
+        <div class="header-line">
+            <div><strong>{{ edu.school }}</strong>, {{ edu.degree }}</div>
+            <div>{{ edu.time }}</div>
+        </div>
+        <p class="subpoints">{{ edu.content }}</p>
+        {% endfor %}
+    </div>
+
+    <div class="section">
+        <h2>Skills</h2>
+        <ul class="subpoints">
+            {% for skill in skills %}
+            <li>{{ skill.skill }} ({{ skill.degree }})</li>
+            {% endfor %}
+        </ul>
+    </div>
+
+    <div class="section">
+        <h2>Achievements</h2>
+        <ul class="subpoints">
+            {% for ach in achievements %}
+            <li>{{ ach }}</li>
+            {% endfor %}
+        </ul>
+    </div>
+{% endblock %}
+</body>
+</html>"""
+
+# 各变体间共用的片段：生成时拼接，避免同一段样式/页眉在源码中重复出现
+_CONTACT_LINE = "{{ location }} · {{ email }} · {{ phone }}"
+
+# clean_compact_2 与 clean_compact_emphasis 共用的基础样式与页眉
+_COMPACT_STYLE_BASE = """
+        body { font-family: 'Segoe UI', sans-serif; font-size: 13px; margin: 2em auto; max-width: 700px; }
+        h1 { text-align: center; font-size: 24px; margin-bottom: 4px; }
+        .meta { text-align: center; font-size: 11px; color: #555; margin-bottom: 20px; }
+        h2 { font-size: 16px; border-bottom: 1px solid #ccc; margin-top: 24px; }
+        .section { margin-bottom: 12px; }"""
+
+_COMPACT_HEADER = """{% block header %}
+    <h1>{{ name }}</h1>
+    <div class="meta">""" + _CONTACT_LINE + """</div>
+{% endblock %}"""
+
+# 两个彩色变体共用的标题与条目样式
+_COLORFUL_SECTION_STYLE = """
+        h2 {
+            color: #0077b6;
+            border-bottom: 2px solid #dee2e6;
+            padding-bottom: 4px;
+            margin-top: 28px;
+        }
+        .section { margin-bottom: 1em; }
+        .header-line {
+            display: flex;
+            justify-content: space-between;
+            font-weight: bold;
+        }
+        .subpoints {
+            font-size: 13px;
+            margin: 0 0 6px 1em;
+            padding-left: 1.2em;
+            color: #343a40;
+        }
+        ul.subpoints { list-style: disc; margin-top: 4px; }
+        li { margin: 2px 0; }"""
+
+# Clean and compact HTML resume template variants
+templates = {
+    "clean_compact_1.html": """{% extends "base_resume.html" %}
+{% block title %}{{ name }} - Resume{% endblock %}
+{% block styles %}
         body { font-family: Helvetica, sans-serif; font-size: 14px; margin: 30px auto; max-width: 720px; color: #333; }
         h1 { text-align: center; font-size: 26px; margin: 0; }
         .contact { text-align: center; font-size: 12px; margin-bottom: 16px; }
@@ -19,12 +122,12 @@ templates = {
         .job, .edu { margin-bottom: 8px; }
         ul { margin-top: 4px; margin-bottom: 4px; padding-left: 20px; }
         li { margin-bottom: 2px; }
-    </style>
-</head>
-<body>
+{% endblock %}
+{% block header %}
     <h1>{{ name }}</h1>
-    <div class="contact">{{ location }} · {{ email }} · {{ phone }}</div>
-
+    <div class="contact">""" + _CONTACT_LINE + """</div>
+{% endblock %}
+{% block sections %}
     <h2>Summary</h2>
     <p>{{ summary }}</p>
 
@@ -57,29 +160,14 @@ templates = {
         <li>{{ ach }}</li>
         {% endfor %}
     </ul>
-</body>
-</html>
-""",
-    "clean_compact_2.html": """
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>{{ name }}</title>
-    <style>
-        body { font-family: 'Segoe UI', sans-serif; font-size: 13px; margin: 2em auto; max-width: 700px; }
-        h1 { text-align: center; font-size: 24px; margin-bottom: 4px; }
-        .meta { text-align: center; font-size: 11px; color: #555; margin-bottom: 20px; }
-        h2 { font-size: 16px; border-bottom: 1px solid #ccc; margin-top: 24px; }
-        .section { margin-bottom: 12px; }
+{% endblock %}""",
+    "clean_compact_2.html": """{% extends "base_resume.html" %}
+{% block styles %}""" + _COMPACT_STYLE_BASE + """
         ul { padding-left: 1.2em; margin: 0; }
         li { margin: 2px 0; }
-    </style>
-</head>
-<body>
-    <h1>{{ name }}</h1>
-    <div class="meta">{{ location }} · {{ email }} · {{ phone }}</div>
-
+{% endblock %}
+""" + _COMPACT_HEADER + """
+{% block sections %}
     <div class="section">
         <h2>Summary</h2>
         <p>{{ summary }}</p>
@@ -122,107 +210,23 @@ templates = {
             {% endfor %}
         </ul>
     </div>
-</body>
-</html>
-"""
+{% endblock %}"""
 }
 
-# Write all templates to disk
-for filename, html in templates.items():
-    (template_dir / filename).write_text(html.strip(), encoding="utf-8")
-
-list(template_dir.glob("clean_*.html"))
-
-
 # 修改 clean_compact_2.html 模板，增强公司突出 + 时间靠右 + 内容小字号紧凑布局
 
-new_clean_template = """
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>{{ name }}</title>
-    <style>
-        body { font-family: 'Segoe UI', sans-serif; font-size: 13px; margin: 2em auto; max-width: 700px; }
-        h1 { text-align: center; font-size: 24px; margin-bottom: 4px; }
-        .meta { text-align: center; font-size: 11px; color: #555; margin-bottom: 20px; }
-        h2 { font-size: 16px; border-bottom: 1px solid #ccc; margin-top: 24px; }
-        .section { margin-bottom: 12px; }
+new_clean_template = """{% extends "base_resume.html" %}
+{% block styles %}""" + _COMPACT_STYLE_BASE + """
         .header-line { display: flex; justify-content: space-between; font-weight: bold; }
         .subpoints { font-size: 12px; margin: 0 0 6px 1em; padding-left: 1em; color: #333; }
         ul.subpoints { list-style: disc; margin-top: 4px; }
         li { margin: 2px 0; }
-    </style>
-</head>
-<body>
-    <h1>{{ name }}</h1>
-    <div class="meta">{{ location }} · {{ email }} · {{ phone }}</div>
-
-    <div class="section">
-        <h2>Summary</h2>
-        <p>{{ summary }}</p>
-    </div>
-
-    <div class="section">
-        <h2>Experience</h2>
-        {% for exp in experiences %}
-        <div class="header-line">
-            <div>{{ exp.title }}, <strong>{{ exp.organization }}</strong></div>
-            <div>{{ exp.time }}</div>
-        </div>
-        <ul class="subpoints">
-            {% for line in exp.content.split('\\n') %}
-            <li>{{ line }}</li>
-            {% endfor %}
-        </ul>
-        {% endfor %}
-    </div>
-
-    <div class="section">
-        <h2>Education</h2>
-        {% for edu in education %}
-        <div class="header-line">
-            <div><strong>{{ edu.school }}</strong>, {{ edu.degree }}</div>
-            <div>{{ edu.time }}</div>
-        </div>
-        <p class="subpoints">{{ edu.content }}</p>
-        {% endfor %}
-    </div>
-
-    <div class="section">
-        <h2>Skills</h2>
-        <ul class="subpoints">
-            {% for skill in skills %}
-            <li>{{ skill.skill }} ({{ skill.degree }})</li>
-            {% endfor %}
-        </ul>
-    </div>
-
-    <div class="section">
-        <h2>Achievements</h2>
-        <ul class="subpoints">
-            {% for ach in achievements %}
-            <li>{{ ach }}</li>
-            {% endfor %}
-        </ul>
-    </div>
-</body>
-</html>
-"""
-
-# 保存为新模板文件
-new_template_path = template_dir / "clean_compact_emphasis.html"
-new_template_path.write_text(new_clean_template.strip(), encoding="utf-8")
-
+{% endblock %}
+""" + _COMPACT_HEADER
 
 # 彩色版本的增强模板：加入人物头像、彩色标题栏、超链接样式
-colorful_template = """
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>{{ name }}</title>
-    <style>
+colorful_template = """{% extends "base_resume.html" %}
+{% block styles %}
         body {
             font-family: 'Segoe UI', sans-serif;
             font-size: 14px;
@@ -253,107 +257,25 @@ colorful_template = """
         a {
             color: #f3f3f3;
             text-decoration: underline;
-        }
-        h2 {
-            color: #0077b6;
-            border-bottom: 2px solid #dee2e6;
-            padding-bottom: 4px;
-            margin-top: 28px;
-        }
-        .section { margin-bottom: 1em; }
-        .header-line {
-            display: flex;
-            justify-content: space-between;
-            font-weight: bold;
-        }
-        .subpoints {
-            font-size: 13px;
-            margin: 0 0 6px 1em;
-            padding-left: 1.2em;
-            color: #343a40;
-        }
-        ul.subpoints { list-style: disc; margin-top: 4px; }
-        li { margin: 2px 0; }
-    </style>
-</head>
-<body>
+        }""" + _COLORFUL_SECTION_STYLE + """
+{% endblock %}
+{% block header %}
     <header>
-        <img src="{{ photo_url or 'https://randomuser.me/api/portraits/men/32.jpg' }}" alt="Profile Photo" />
+        <img src="{{ photo_url|default('https://randomuser.me/api/portraits/men/32.jpg', true) }}" alt="Profile Photo" />
         <div>
             <h1 style="margin: 0;">{{ name }}</h1>
             <div class="contact">
-                {{ location }} · {{ email }} · {{ phone }}<br>
+                """ + _CONTACT_LINE + """<br>
                 <a href="{{ linkedin }}">{{ linkedin }}</a>
             </div>
         </div>
     </header>
 
-    <div class="section">
-        <h2>Summary</h2>
-        <p>{{ summary }}</p>
-    </div>
-
-    <div class="section">
-        <h2>Experience</h2>
-        {% for exp in experiences %}
-        <div class="header-line">
-            <div>{{ exp.title }}, <strong>{{ exp.organization }}</strong></div>
-            <div>{{ exp.time }}</div>
-        </div>
-        <ul class="subpoints">
-            {% for line in exp.content.split('\\n') %}
-            <li>{{ line }}</li>
-            {% endfor %}
-        </ul>
-        {% endfor %}
-    </div>
-
-    <div class="section">
-        <h2>Education</h2>
-        {% for edu in education %}
-        <div class="header-line">
-            <div><strong>{{ edu.school }}</strong>, {{ edu.degree }}</div>
-            <div>{{ edu.time }}</div>
-        </div>
-        <p class="subpoints">{{ edu.content }}</p>
-        {% endfor %}
-    </div>
-
-    <div class="section">
-        <h2>Skills</h2>
-        <ul class="subpoints">
-            {% for skill in skills %}
-            <li>{{ skill.skill }} ({{ skill.degree }})</li>
-            {% endfor %}
-        </ul>
-    </div>
-
-    <div class="section">
-        <h2>Achievements</h2>
-        <ul class="subpoints">
-            {% for ach in achievements %}
-            <li>{{ ach }}</li>
-            {% endfor %}
-        </ul>
-    </div>
-</body>
-</html>
-"""
-
-# 写入模板文件
-color_template_path = template_dir / "clean_colorful_profile.html"
-color_template_path.write_text(colorful_template.strip(), encoding="utf-8")
-
-
+{% endblock %}"""
 
 # 彩色版本（无头像版）HTML简历模板，适合无图 GitHub Pages 展示
-colorful_no_photo_template = """
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>{{ name }}</title>
-    <style>
+colorful_no_photo_template = """{% extends "base_resume.html" %}
+{% block styles %}
         body {
             font-family: 'Segoe UI', sans-serif;
             font-size: 14px;
@@ -376,93 +298,56 @@ colorful_no_photo_template = """
         a {
             color: #f1f1f1;
             text-decoration: underline;
-        }
-        h2 {
-            color: #0077b6;
-            border-bottom: 2px solid #dee2e6;
-            padding-bottom: 4px;
-            margin-top: 28px;
-        }
-        .section { margin-bottom: 1em; }
-        .header-line {
-            display: flex;
-            justify-content: space-between;
-            font-weight: bold;
-        }
-        .subpoints {
-            font-size: 13px;
-            margin: 0 0 6px 1em;
-            padding-left: 1.2em;
-            color: #343a40;
-        }
-        ul.subpoints { list-style: disc; margin-top: 4px; }
-        li { margin: 2px 0; }
-    </style>
-</head>
-<body>
+        }""" + _COLORFUL_SECTION_STYLE + """
+{% endblock %}
+{% block header %}
     <header>
         <h1 style="margin: 0;">{{ name }}</h1>
         <div class="contact">
-            {{ location }} · {{ email }} · {{ phone }}<br>
+            """ + _CONTACT_LINE + """<br>
             <a href="{{ linkedin }}">{{ linkedin }}</a>
         </div>
     </header>
 
-    <div class="section">
-        <h2>Summary</h2>
-        <p>{{ summary }}</p>
-    </div>
+{% endblock %}"""
 
-    <div class="section">
-        <h2>Experience</h2>
-        {% for exp in experiences %}
-        <div class="header-line">
-            <div>{{ exp.title }}, <strong>{{ exp.organization }}</strong></div>
-            <div>{{ exp.time }}</div>
-        </div>
-        <ul class="subpoints">
-            {% for line in exp.content.split('\\n') %}
-            <li>{{ line }}</li>
-            {% endfor %}
-        </ul>
-        {% endfor %}
-    </div>
+# 所有待写出的模板：文件名 -> 模板内容
+# （模板字面量本身已去除首尾空白，写出时无需再 strip）
+all_templates = {
+    "base_resume.html": base_template,
+    **templates,
+    "clean_compact_emphasis.html": new_clean_template,
+    "clean_colorful_profile.html": colorful_template,
+    "clean_colorful_nophoto.html": colorful_no_photo_template,
+}
 
-    <div class="section">
-        <h2>Education</h2>
-        {% for edu in education %}
-        <div class="header-line">
-            <div><strong>{{ edu.school }}</strong>, {{ edu.degree }}</div>
-            <div>{{ edu.time }}</div>
-        </div>
-        <p class="subpoints">{{ edu.content }}</p>
-        {% endfor %}
-    </div>
 
-    <div class="section">
-        <h2>Skills</h2>
-        <ul class="subpoints">
-            {% for skill in skills %}
-            <li>{{ skill.skill }} ({{ skill.degree }})</li>
-            {% endfor %}
-        </ul>
-    </div>
+def _write_if_changed(path: Path, html: str) -> str:
+    """写出单个模板；已是最新或内容一致时跳过，返回状态说明"""
+    if is_up_to_date(path, __file__):
+        return f"[=] Up to date: {path.name}"
 
-    <div class="section">
-        <h2>Achievements</h2>
-        <ul class="subpoints">
-            {% for ach in achievements %}
-            <li>{{ ach }}</li>
-            {% endfor %}
-        </ul>
-    </div>
-</body>
-</html>
-"""
+    data = html.encode("utf-8")
+    if path.exists() and path.read_bytes() == data:
+        return f"[=] Unchanged: {path.name}"
+
+    # 写入已编码的字节，跳过文本包装层
+    path.write_bytes(data)
+    return f"[✔] Written: {path.name}"
+
+
+def main():
+    template_dir.mkdir(parents=True, exist_ok=True)
+
+    # Write all templates to disk (file I/O releases the GIL, so writes overlap)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = executor.map(
+            lambda item: _write_if_changed(template_dir / item[0], item[1]),
+            all_templates.items(),
+        )
+        for message in results:
+            print(message)
 
-# 保存为新模板文件
-color_no_img_template_path = template_dir / "clean_colorful_nophoto.html"
-color_no_img_template_path.parent.mkdir(parents=True, exist_ok=True)
-color_no_img_template_path.write_text(colorful_no_photo_template.strip(), encoding="utf-8")
 
-color_no_img_template_path.name
+if __name__ == "__main__":
+    main()
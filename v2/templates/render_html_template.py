@@ -1,19 +1,138 @@
 import argparse
 import json
+import os
+from multiprocessing import Pool
+from functools import lru_cache
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import ChoiceLoader, Environment, FileSystemBytecodeCache, FileSystemLoader, ModuleLoader, TemplateNotFound
+
+try:
+    import minijinja
+except ImportError:
+    minijinja = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 预编译模板所在的子目录（由 compile_templates 生成）
+COMPILED_DIRNAME = "compiled"
+
+# 编译与渲染共用的环境选项：去掉块标签所在行的空白，减少渲染时输出的纯空白片段
+_ENV_OPTIONS = {"trim_blocks": True, "lstrip_blocks": True}
+
+
+class _FreshModuleLoader(ModuleLoader):
+    """只加载比源模板新的预编译模块；源模板修改后视为未找到，交由 FileSystemLoader 重新编译"""
+
+    def __init__(self, compiled_dir: Path, template_dir: Path):
+        super().__init__(str(compiled_dir))
+        self.compiled_dir = compiled_dir
+        self.template_dir = template_dir
+
+    def load(self, environment, name, globals=None):
+        try:
+            compiled_mtime = (self.compiled_dir / self.get_module_filename(name)).stat().st_mtime_ns
+            source_mtime = (self.template_dir / name).stat().st_mtime_ns
+        except OSError:
+            raise TemplateNotFound(name)
+        if compiled_mtime < source_mtime:
+            raise TemplateNotFound(name)
+        return super().load(environment, name, globals)
+
+
+@lru_cache(maxsize=32)
+def get_environment(template_dir: str) -> Environment:
+    """按模板目录缓存 Jinja2 环境；存在未过期的预编译模块时优先直接导入，免去解析与编译"""
+    loader = FileSystemLoader(template_dir)
+    compiled_dir = Path(template_dir) / COMPILED_DIRNAME
+    if compiled_dir.is_dir():
+        loader = ChoiceLoader([_FreshModuleLoader(compiled_dir, Path(template_dir)), loader])
+
+    return Environment(
+        loader=loader,
+        auto_reload=False,
+        cache_size=400,
+        bytecode_cache=FileSystemBytecodeCache(),
+        **_ENV_OPTIONS,
+    )
+
+
+def compile_templates(template_dir: Path) -> Path:
+    """将目录下的 HTML 模板预编译为 Python 模块，供 ModuleLoader 加载（模板修改后旧模块自动失效，重新编译即可恢复加速）"""
+    target = template_dir / COMPILED_DIRNAME
+    env = Environment(loader=FileSystemLoader(str(template_dir)), **_ENV_OPTIONS)
+    env.compile_templates(
+        str(target),
+        zip=None,
+        filter_func=lambda name: name.endswith(".html"),
+        ignore_errors=False,
+    )
+    get_environment.cache_clear()
+    return target
+
+
+@lru_cache(maxsize=32)
+def get_minijinja_environment(template_dir: str):
+    """按模板目录缓存 MiniJinja 环境（Rust 实现，渲染开销更低）"""
+    base = Path(template_dir)
+
+    def load(name):
+        path = base / name
+        return path.read_text(encoding="utf-8") if path.is_file() else None
+
+    # 与 Jinja2 默认行为保持一致：不做 HTML 自动转义
+    return minijinja.Environment(
+        loader=load,
+        auto_escape_callback=lambda name: False,
+        **_ENV_OPTIONS,
+    )
+
+
+@lru_cache(maxsize=64)
+def _load_json_cached(path: str, mtime_ns: int) -> dict:
+    """解析 JSON 文件；以 (路径, mtime) 为键缓存，文件修改后自动失效"""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_resume_data(json_path: Path) -> dict:
+    """加载 JSON 简历数据（同一文件多次渲染时只解析一次）"""
+    return _load_json_cached(str(json_path), json_path.stat().st_mtime_ns)
+
+
+def render_template(template_path: Path, context: dict) -> str:
+    """渲染模板；安装了 minijinja 时优先使用，否则回退到 Jinja2"""
+    template_dir = str(template_path.parent.resolve())
+    if minijinja is not None:
+        env = get_minijinja_environment(template_dir)
+        return env.render_template(template_path.name, **context)
+
+    env = get_environment(template_dir)
+    return env.get_template(template_path.name).render(**context)
+
+
+# 简历未提供头像时使用的默认图片（与 clean_colorful_profile.html 中的 default 一致）
+DEFAULT_PHOTO_URL = "https://randomuser.me/api/portraits/men/32.jpg"
+
+
+def with_render_defaults(resume_data: dict) -> dict:
+    """缺省字段在渲染前一次性补齐；返回新字典，不修改缓存中的数据"""
+    if resume_data.get("photo_url"):
+        return resume_data
+    return {**resume_data, "photo_url": DEFAULT_PHOTO_URL}
+
 
 def render_resume(json_path: Path, template_path: Path, output_path: Path = None):
     # 加载 JSON 简历数据
-    with open(json_path, "r", encoding="utf-8") as f:
-        resume_data = json.load(f)
-
-    # 设置 Jinja2 环境
-    env = Environment(loader=FileSystemLoader(template_path.parent))
-    template = env.get_template(template_path.name)
+    resume_data = with_render_defaults(load_resume_data(json_path))
 
     # 渲染 HTML 内容
-    rendered_html = template.render(**resume_data)
+    rendered_html = render_template(template_path, resume_data)
 
     # 生成默认输出路径
     if output_path is None:
@@ -24,12 +143,59 @@ def render_resume(json_path: Path, template_path: Path, output_path: Path = None
     output_path.write_text(rendered_html, encoding="utf-8")
     print(f"[✔] Resume rendered successfully → {output_path.resolve()}")
 
+# 批量渲染时每个工作进程持有的模板路径（由 _init_worker 设置）
+_worker_template_path = None
+
+
+def _init_worker(template_path: Path):
+    """工作进程初始化：预编译模板，之后每个任务只需渲染"""
+    global _worker_template_path
+    _worker_template_path = template_path
+    if minijinja is None:
+        get_environment(str(template_path.parent.resolve())).get_template(template_path.name)
+
+
+def _render_worker(job):
+    json_path, output_path = job
+    resume_data = with_render_defaults(load_resume_data(json_path))
+    output_path.write_text(render_template(_worker_template_path, resume_data), encoding="utf-8")
+    return output_path
+
+
+def render_batch(json_dir: Path, template_path: Path, out_dir: Path = None, workers: int = None):
+    """将目录下所有 JSON 简历用同一模板并行渲染"""
+    out_dir = out_dir or json_dir
+    out_dir.mkdir(parents=True, exist_ok=True)
+    suffix = f".rendered_{template_path.stem}.html"
+    jobs = [(p, out_dir / p.with_suffix(suffix).name) for p in sorted(json_dir.glob("*.json"))]
+    if not jobs:
+        print(f"[!] No JSON files found in {json_dir}")
+        return []
+
+    workers = min(len(jobs), workers or os.cpu_count() or 1)
+    with Pool(workers, initializer=_init_worker, initargs=(template_path,)) as pool:
+        outputs = pool.map(_render_worker, jobs)
+
+    print(f"[✔] Rendered {len(outputs)} resumes → {out_dir.resolve()}")
+    return outputs
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Render HTML resume using a JSON profile and Jinja2 template.")
-    parser.add_argument("profile_json", type=Path, help="Path to resume JSON data file")
-    parser.add_argument("template_html", type=Path, help="Path to Jinja2-compatible HTML template")
-    parser.add_argument("--output", type=Path, help="Optional output HTML file path")
+    parser.add_argument("profile_json", type=Path, nargs="?", help="Path to resume JSON data file (or a directory of them)")
+    parser.add_argument("template_html", type=Path, nargs="?", help="Path to Jinja2-compatible HTML template")
+    parser.add_argument("--output", type=Path, help="Optional output HTML file path (output directory in batch mode)")
+    parser.add_argument("--workers", type=int, help="Number of worker processes in batch mode")
+    parser.add_argument("--compile", type=Path, metavar="TEMPLATE_DIR",
+                        help="Precompile all HTML templates in TEMPLATE_DIR for ModuleLoader and exit")
 
     args = parser.parse_args()
 
-    render_resume(args.profile_json, args.template_html, args.output)
+    if args.compile:
+        target = compile_templates(args.compile)
+        print(f"[✔] Templates compiled → {target.resolve()}")
+    elif args.profile_json is None or args.template_html is None:
+        parser.error("profile_json and template_html are required unless --compile is given")
+    elif args.profile_json.is_dir():
+        render_batch(args.profile_json, args.template_html, args.output, args.workers)
+    else:
+        render_resume(args.profile_json, args.template_html, args.output)
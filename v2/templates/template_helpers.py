@@ -0,0 +1,7 @@
+# 模板生成脚本共用的小工具
+from pathlib import Path
+
+
+def is_up_to_date(path: Path, script: str) -> bool:
+    """输出文件已存在且比生成它的脚本新时无需重新生成"""
+    return path.exists() and path.stat().st_mtime > Path(script).stat().st_mtime
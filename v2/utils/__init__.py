@@ -2,14 +2,26 @@
 Utility modules for file operations and version management.
 """
 
-from .file_utils import FileUtils
-from .version_manager import VersionManager
-from .path_utils import (
-    normalize_path, safe_join, create_safe_directory,
-    get_valid_filename, get_temp_dir, get_platform_info,
-    get_home_dir, get_desktop_dir, get_documents_dir,
-    is_safe_path, get_file_extension, list_files_by_extension
-)
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562), so importing
+# one helper doesn't pull in every utility module
+_LAZY_ATTRS = {
+    'FileUtils': '.file_utils',
+    'VersionManager': '.version_manager',
+    'normalize_path': '.path_utils',
+    'safe_join': '.path_utils',
+    'create_safe_directory': '.path_utils',
+    'get_valid_filename': '.path_utils',
+    'get_temp_dir': '.path_utils',
+    'get_platform_info': '.path_utils',
+    'get_home_dir': '.path_utils',
+    'get_desktop_dir': '.path_utils',
+    'get_documents_dir': '.path_utils',
+    'is_safe_path': '.path_utils',
+    'get_file_extension': '.path_utils',
+    'list_files_by_extension': '.path_utils',
+}
 
 __all__ = [
     'FileUtils', 
@@ -26,4 +38,18 @@ __all__ = [
     'is_safe_path',
     'get_file_extension',
     'list_files_by_extension'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import the submodule providing `name` on first access and cache it."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,20 +3,105 @@ File utilities for common file operations and data handling.
 """
 
 import os
+import errno
+import stat
+import fnmatch
+import sys
 import json
+import mmap
 import shutil
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Chunk size for buffered file copies (larger chunks mean far fewer read/write calls)
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# JSON files at least this large are memory-mapped instead of read into a bytes copy
+MMAP_JSON_THRESHOLD = 1024 * 1024
+
+# JSON files larger than this are parsed incrementally with ijson (when installed)
+STREAM_JSON_THRESHOLD = 4 * 1024 * 1024
+
+# Worker threads used to unlink files when removing a directory tree
+RMTREE_WORKERS = 16
+
+# Cleared once O_TMPFILE proves unsupported so later temp files go straight to the fallback
+_o_tmpfile_usable = True
+
+# errno values from os.open meaning O_TMPFILE itself is unsupported (not a transient I/O error)
+_O_TMPFILE_UNSUPPORTED = frozenset({errno.EOPNOTSUPP, errno.EISDIR, errno.EINVAL})
+
+# Upper bound per zero-copy syscall; the loops below repeat until EOF
+_ZERO_COPY_CHUNK = 1 << 30
+
+
+def _copy_file_contents(fsrc, fdst) -> None:
+    """
+    Copy an open source file into an open destination file.
+    
+    Prefers in-kernel copies (copy_file_range, then sendfile on Linux) and
+    falls back to a buffered loop when they are unavailable or fail, e.g.
+    across filesystems (EXDEV).
+    
+    Args:
+        fsrc: Source file opened in binary read mode
+        fdst: Destination file opened in binary write mode
+    """
+    infd, outfd = fsrc.fileno(), fdst.fileno()
+    copied = 0
+    
+    copy_file_range = getattr(os, 'copy_file_range', None)
+    if copy_file_range is not None:
+        try:
+            while True:
+                sent = copy_file_range(infd, outfd, _ZERO_COPY_CHUNK)
+                if sent == 0:
+                    return
+                copied += sent
+        except OSError:
+            pass
+    
+    if sys.platform.startswith('linux') and hasattr(os, 'sendfile'):
+        try:
+            while True:
+                sent = os.sendfile(outfd, infd, copied, _ZERO_COPY_CHUNK)
+                if sent == 0:
+                    return
+                copied += sent
+        except OSError:
+            pass
+    
+    # Resume the buffered copy from wherever the fast paths stopped
+    fsrc.seek(copied)
+    fdst.seek(copied)
+    shutil.copyfileobj(fsrc, fdst, length=COPY_BUFFER_SIZE)
+
+
+_LOG = logging.getLogger(__name__)
+
 
 class FileUtils:
     """Utility class for file operations and data handling."""
     
     def __init__(self):
-        self.logger = logging.getLogger(__name__)
+        # Kept for callers that use the instance logger; the methods log via _LOG
+        self.logger = _LOG
     
-    def ensure_directory(self, directory_path: str) -> Path:
+    @staticmethod
+    def ensure_directory(directory_path: str) -> Path:
         """
         Ensure directory exists, create if it doesn't.
         
@@ -30,7 +115,8 @@ class FileUtils:
         path.mkdir(parents=True, exist_ok=True)
         return path
     
-    def save_text_file(self, content: str, file_path: str, encoding: str = 'utf-8') -> str:
+    @staticmethod
+    def save_text_file(content: str, file_path: str, encoding: str = 'utf-8') -> str:
         """
         Save text content to file.
         
@@ -47,17 +133,21 @@ class FileUtils:
             # Ensure parent directory exists
             path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(path, 'w', encoding=encoding) as file:
-                file.write(content)
+            # Encode once and write in a single call, skipping the text/buffer layers.
+            # Translate newlines as text mode would (CRLF on Windows).
+            if os.linesep != '\n':
+                content = content.replace('\n', os.linesep)
+            path.write_bytes(content.encode(encoding))
                 
-            self.logger.info(f"Saved text file: {file_path}")
+            _LOG.info("Saved text file: %s", file_path)
             return str(path.absolute())
             
         except Exception as e:
-            self.logger.error(f"Error saving text file {file_path}: {str(e)}")
+            _LOG.error("Error saving text file %s: %s", file_path, e)
             raise Exception(f"Failed to save text file: {str(e)}")
     
-    def load_text_file(self, file_path: str, encoding: str = 'utf-8') -> str:
+    @staticmethod
+    def load_text_file(file_path: str, encoding: str = 'utf-8') -> str:
         """
         Load text content from file.
         
@@ -69,27 +159,36 @@ class FileUtils:
             File content as string
         """
         try:
-            with open(file_path, 'r', encoding=encoding) as file:
-                content = file.read()
+            raw = Path(file_path).read_bytes()
+            try:
+                content = FileUtils._decode_text(raw, encoding)
+            except UnicodeDecodeError:
+                # Try with different encoding, reusing the bytes already read
+                try:
+                    content = FileUtils._decode_text(raw, 'latin-1')
+                    _LOG.warning("Used fallback encoding for: %s", file_path)
+                    return content
+                except Exception as e:
+                    raise Exception(f"Failed to read file with any encoding: {str(e)}")
                 
-            self.logger.info(f"Loaded text file: {file_path}")
+            _LOG.info("Loaded text file: %s", file_path)
             return content
-            
-        except UnicodeDecodeError:
-            # Try with different encoding
-            try:
-                with open(file_path, 'r', encoding='latin-1') as file:
-                    content = file.read()
-                self.logger.warning(f"Used fallback encoding for: {file_path}")
-                return content
-            except Exception as e:
-                raise Exception(f"Failed to read file with any encoding: {str(e)}")
                 
         except Exception as e:
-            self.logger.error(f"Error loading text file {file_path}: {str(e)}")
+            _LOG.error("Error loading text file %s: %s", file_path, e)
             raise Exception(f"Failed to load text file: {str(e)}")
     
-    def save_json(self, data: Dict[str, Any], file_path: str, indent: int = 2) -> str:
+    @staticmethod
+    def _decode_text(raw: bytes, encoding: str) -> str:
+        """Decode file bytes with universal newlines, as text-mode open() would."""
+        content = raw.decode(encoding)
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+    
+    @staticmethod
+    def save_json(data: Dict[str, Any], file_path: str, indent: int = 2,
+                  compact: bool = False) -> str:
         """
         Save data as JSON file.
         
@@ -97,6 +196,8 @@ class FileUtils:
             data: Data to save
             file_path: Path where to save the file
             indent: JSON indentation
+            compact: Write minified JSON (no indentation or spaces) for
+                machine-consumed files; ignores indent
             
         Returns:
             Absolute path to saved file
@@ -105,20 +206,31 @@ class FileUtils:
             path = Path(file_path)
             path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(path, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=indent, ensure_ascii=False)
+            if orjson is not None and (compact or indent == 2):
+                # orjson emits UTF-8 bytes directly (non-ASCII kept, like ensure_ascii=False)
+                option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                path.write_bytes(orjson.dumps(data, option=option))
+            elif compact:
+                path.write_bytes(json.dumps(data, separators=(',', ':')).encode('utf-8'))
+            else:
+                # Serialize in memory and write once; json.dump would issue many small writes
+                path.write_bytes(json.dumps(data, indent=indent, ensure_ascii=False).encode('utf-8'))
                 
-            self.logger.info(f"Saved JSON file: {file_path}")
+            _LOG.info("Saved JSON file: %s", file_path)
             return str(path.absolute())
             
         except Exception as e:
-            self.logger.error(f"Error saving JSON file {file_path}: {str(e)}")
+            _LOG.error("Error saving JSON file %s: %s", file_path, e)
             raise Exception(f"Failed to save JSON file: {str(e)}")
     
-    def load_json(self, file_path: str) -> Dict[str, Any]:
+    @staticmethod
+    def load_json(file_path: str) -> Dict[str, Any]:
         """
         Load data from JSON file.
         
+        Files larger than STREAM_JSON_THRESHOLD are parsed incrementally with
+        ijson when it is installed, so the raw text is never held in memory.
+        
         Args:
             file_path: Path to JSON file
             
@@ -126,17 +238,86 @@ class FileUtils:
             Loaded data as dictionary
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
+            if ijson is not None and os.stat(file_path).st_size > STREAM_JSON_THRESHOLD:
+                with open(file_path, 'rb') as file:
+                    # Prefix '' is the document root; floats stay floats as with json.load
+                    data = next(ijson.items(file, '', use_float=True))
+            elif orjson is not None:
+                data = FileUtils._load_json_orjson(Path(file_path))
+            else:
+                with open(file_path, 'r', encoding='utf-8') as file:
+                    data = json.load(file)
                 
-            self.logger.info(f"Loaded JSON file: {file_path}")
+            _LOG.info("Loaded JSON file: %s", file_path)
             return data
             
         except Exception as e:
-            self.logger.error(f"Error loading JSON file {file_path}: {str(e)}")
+            _LOG.error("Error loading JSON file %s: %s", file_path, e)
             raise Exception(f"Failed to load JSON file: {str(e)}")
     
-    def copy_file(self, source_path: str, destination_path: str) -> str:
+    @staticmethod
+    def _load_json_orjson(path: Path) -> Any:
+        """Parse a JSON file with orjson, memory-mapping large files to skip the read copy."""
+        with open(path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            mapped = None
+            if size >= MMAP_JSON_THRESHOLD:
+                try:
+                    mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    # mmap unsupported for this file (e.g. special filesystems); read normally
+                    mapped = None
+            if mapped is None:
+                return orjson.loads(file.read())
+            view = memoryview(mapped)
+            try:
+                return orjson.loads(view)
+            finally:
+                view.release()
+                mapped.close()
+    
+    @staticmethod
+    def load_json_stream(file_path: str, prefix: str = 'item') -> Iterator[Any]:
+        """
+        Iterate over the JSON values found under a prefix without loading the whole document.
+        
+        Prefixes use ijson syntax: dotted keys, with 'item' for each array element
+        (e.g. 'item' for a top-level array, 'profiles.item' for data['profiles']).
+        Without ijson installed the file is loaded in full and walked the same way.
+        
+        Args:
+            file_path: Path to JSON file
+            prefix: ijson prefix of the values to yield
+            
+        Returns:
+            Iterator over the matching values
+        """
+        if ijson is None:
+            yield from FileUtils._iter_prefix(FileUtils.load_json(file_path), prefix.split('.') if prefix else [])
+            return
+            
+        try:
+            with open(file_path, 'rb') as file:
+                yield from ijson.items(file, prefix)
+        except Exception as e:
+            _LOG.error("Error streaming JSON file %s: %s", file_path, e)
+            raise Exception(f"Failed to stream JSON file: {str(e)}")
+    
+    @classmethod
+    def _iter_prefix(cls, node: Any, parts: List[str]) -> Iterator[Any]:
+        """Yield the values of an in-memory document that match ijson prefix parts."""
+        if not parts:
+            yield node
+            return
+        head, rest = parts[0], parts[1:]
+        if head == 'item' and isinstance(node, list):
+            for element in node:
+                yield from cls._iter_prefix(element, rest)
+        elif isinstance(node, dict) and head in node:
+            yield from cls._iter_prefix(node[head], rest)
+    
+    @staticmethod
+    def copy_file(source_path: str, destination_path: str) -> str:
         """
         Copy file from source to destination.
         
@@ -154,19 +335,31 @@ class FileUtils:
             if not source.exists():
                 raise FileNotFoundError(f"Source file not found: {source_path}")
                 
+            # Match shutil.copy2: copying onto a directory keeps the source name
+            if destination.is_dir():
+                destination = destination / source.name
+                
+            # Match shutil.copy2: opening the destination for writing would
+            # truncate the source when both names refer to the same file
+            if destination.exists() and os.path.samefile(source, destination):
+                raise shutil.SameFileError(f"{source_path} and {destination_path} are the same file")
+            
             # Ensure destination directory exists
             destination.parent.mkdir(parents=True, exist_ok=True)
             
-            shutil.copy2(source, destination)
+            with open(source, 'rb') as fsrc, open(destination, 'wb') as fdst:
+                _copy_file_contents(fsrc, fdst)
+            shutil.copystat(source, destination)
             
-            self.logger.info(f"Copied file: {source_path} -> {destination_path}")
+            _LOG.info("Copied file: %s -> %s", source_path, destination_path)
             return str(destination.absolute())
             
         except Exception as e:
-            self.logger.error(f"Error copying file: {str(e)}")
+            _LOG.error("Error copying file: %s", e)
             raise Exception(f"Failed to copy file: {str(e)}")
     
-    def move_file(self, source_path: str, destination_path: str) -> str:
+    @staticmethod
+    def move_file(source_path: str, destination_path: str) -> str:
         """
         Move file from source to destination.
         
@@ -184,19 +377,31 @@ class FileUtils:
             if not source.exists():
                 raise FileNotFoundError(f"Source file not found: {source_path}")
                 
+            # Match shutil.move: moving onto a directory keeps the source name
+            if destination.is_dir():
+                destination = destination / source.name
+                
             # Ensure destination directory exists
             destination.parent.mkdir(parents=True, exist_ok=True)
             
-            shutil.move(str(source), str(destination))
-            
-            self.logger.info(f"Moved file: {source_path} -> {destination_path}")
+            try:
+                # Same filesystem: one atomic rename
+                os.replace(source, destination)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # Crossing filesystems needs a copy + delete
+                shutil.move(str(source), str(destination))
+            
+            _LOG.info("Moved file: %s -> %s", source_path, destination_path)
             return str(destination.absolute())
             
         except Exception as e:
-            self.logger.error(f"Error moving file: {str(e)}")
+            _LOG.error("Error moving file: %s", e)
             raise Exception(f"Failed to move file: {str(e)}")
     
-    def remove_file(self, file_path: str) -> bool:
+    @staticmethod
+    def remove_file(file_path: str) -> bool:
         """
         Remove file if it exists.
         
@@ -211,17 +416,18 @@ class FileUtils:
             
             if path.exists():
                 path.unlink()
-                self.logger.info(f"Removed file: {file_path}")
+                _LOG.info("Removed file: %s", file_path)
                 return True
             else:
-                self.logger.warning(f"File not found for removal: {file_path}")
+                _LOG.warning("File not found for removal: %s", file_path)
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Error removing file {file_path}: {str(e)}")
+            _LOG.error("Error removing file %s: %s", file_path, e)
             raise Exception(f"Failed to remove file: {str(e)}")
     
-    def remove_directory(self, directory_path: str) -> bool:
+    @staticmethod
+    def remove_directory(directory_path: str) -> bool:
         """
         Remove directory and all its contents.
         
@@ -235,19 +441,69 @@ class FileUtils:
             path = Path(directory_path)
             
             if path.exists() and path.is_dir():
-                shutil.rmtree(path)
-                self.logger.info(f"Removed directory: {directory_path}")
+                # Match shutil.rmtree: never walk into a symlinked root
+                if path.is_symlink():
+                    raise OSError("Cannot call rmtree on a symbolic link")
+                try:
+                    FileUtils._fast_rmtree(path)
+                except OSError:
+                    # Finish whatever is left the conventional way
+                    shutil.rmtree(path)
+                _LOG.info("Removed directory: %s", directory_path)
                 return True
             else:
-                self.logger.warning(f"Directory not found for removal: {directory_path}")
+                _LOG.warning("Directory not found for removal: %s", directory_path)
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Error removing directory {directory_path}: {str(e)}")
+            _LOG.error("Error removing directory %s: %s", directory_path, e)
             raise Exception(f"Failed to remove directory: {str(e)}")
     
-    def list_files(self, directory_path: str, pattern: str = "*", 
-                  recursive: bool = False) -> List[str]:
+    @staticmethod
+    def _fast_rmtree(root: Path) -> None:
+        """
+        Remove a directory tree, unlinking files in parallel.
+        
+        Files are unlinked by a thread pool (the syscalls release the GIL, which
+        helps most on network filesystems); directories are then removed
+        bottom-up in the calling thread. Symlinks inside the tree are unlinked,
+        never followed; a symlinked root is refused.
+        
+        Args:
+            root: Directory to remove
+            
+        Raises:
+            OSError: If root is a symbolic link
+        """
+        if os.path.islink(root):
+            raise OSError("Cannot call rmtree on a symbolic link")
+        
+        files = []
+        directories = []
+        pending = [str(root)]
+        while pending:
+            current = pending.pop()
+            directories.append(current)
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        
+        if files:
+            with ThreadPoolExecutor(max_workers=min(RMTREE_WORKERS, len(files))) as executor:
+                # Consume the results so the first failure is raised here
+                for _ in executor.map(os.unlink, files):
+                    pass
+        
+        # Children were discovered after their parents, so reverse order is bottom-up
+        for directory in reversed(directories):
+            os.rmdir(directory)
+    
+    @staticmethod
+    def list_files(directory_path: str, pattern: str = "*", 
+                   recursive: bool = False) -> List[str]:
         """
         List files in directory matching pattern.
         
@@ -262,24 +518,65 @@ class FileUtils:
         try:
             path = Path(directory_path)
             
-            if not path.exists():
+            if not path.is_dir():
                 return []
                 
-            if recursive:
-                files = list(path.rglob(pattern))
+            if pattern == "*":
+                # Match-everything pattern: no fnmatch needed, just keep the files
+                file_paths = FileUtils._scan_files(path, recursive)
+            elif recursive or os.sep in pattern or (os.altsep and os.altsep in pattern):
+                files = path.rglob(pattern) if recursive else path.glob(pattern)
+                    
+                # Filter only files (not directories)
+                file_paths = [str(f) for f in files if f.is_file()]
             else:
-                files = list(path.glob(pattern))
-                
-            # Filter only files (not directories)
-            file_paths = [str(f) for f in files if f.is_file()]
+                # Single-level listing: scandir's cached entry type avoids a stat per file
+                with os.scandir(path) as entries:
+                    file_paths = [
+                        str(path / entry.name) for entry in entries
+                        if fnmatch.fnmatch(entry.name, pattern) and entry.is_file()
+                    ]
             
             return sorted(file_paths)
             
         except Exception as e:
-            self.logger.error(f"Error listing files in {directory_path}: {str(e)}")
+            _LOG.error("Error listing files in %s: %s", directory_path, e)
             return []
     
-    def get_file_size(self, file_path: str) -> int:
+    @staticmethod
+    def _scan_files(path: Path, recursive: bool) -> List[str]:
+        """
+        Collect every file under a directory with os.scandir.
+        
+        Like Path.rglob, symlinked directories are not descended into and
+        unreadable subdirectories are skipped.
+        
+        Args:
+            path: Directory to scan
+            recursive: Whether to descend into subdirectories
+            
+        Returns:
+            Unsorted list of file paths
+        """
+        file_paths = []
+        pending = [path]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            # Join through Path so results match the glob branches ('a.txt', not './a.txt')
+                            file_paths.append(str(current / entry.name))
+                        elif recursive and entry.is_dir(follow_symlinks=False):
+                            pending.append(current / entry.name)
+            except PermissionError:
+                if current is path:
+                    raise
+        return file_paths
+    
+    @staticmethod
+    def get_file_size(file_path: str) -> int:
         """
         Get file size in bytes.
         
@@ -294,7 +591,8 @@ class FileUtils:
         except Exception:
             return 0
     
-    def create_temp_file(self, content: str, suffix: str = ".tmp") -> str:
+    @staticmethod
+    def create_temp_file(content: str, suffix: str = ".tmp") -> str:
         """
         Create temporary file with content.
         
@@ -306,19 +604,74 @@ class FileUtils:
             Path to temporary file
         """
         try:
-            with tempfile.NamedTemporaryFile(mode='w', suffix=suffix, 
-                                           delete=False, encoding='utf-8') as temp_file:
-                temp_file.write(content)
-                temp_path = temp_file.name
+            temp_path = FileUtils._create_temp_file_linux(content.encode('utf-8'), suffix)
+            if temp_path is None:
+                with tempfile.NamedTemporaryFile(mode='w', suffix=suffix, 
+                                               delete=False, encoding='utf-8') as temp_file:
+                    temp_file.write(content)
+                    temp_path = temp_file.name
                 
-            self.logger.info(f"Created temporary file: {temp_path}")
+            _LOG.info("Created temporary file: %s", temp_path)
             return temp_path
             
         except Exception as e:
-            self.logger.error(f"Error creating temporary file: {str(e)}")
+            _LOG.error("Error creating temporary file: %s", e)
             raise Exception(f"Failed to create temporary file: {str(e)}")
     
-    def validate_path(self, file_path: str) -> Dict[str, Any]:
+    @staticmethod
+    def _create_temp_file_linux(data: bytes, suffix: str) -> Optional[str]:
+        """
+        Write data to an anonymous O_TMPFILE inode, then link it under a unique name.
+        
+        Needs fewer syscalls and no Python file objects compared with
+        NamedTemporaryFile.
+        
+        Args:
+            data: Encoded file content
+            suffix: File suffix
+            
+        Returns:
+            Path to the new file, or None when O_TMPFILE is unavailable
+        """
+        global _o_tmpfile_usable
+        o_tmpfile = getattr(os, 'O_TMPFILE', None)
+        if not _o_tmpfile_usable or o_tmpfile is None or not sys.platform.startswith('linux'):
+            return None
+        
+        temp_dir = tempfile.gettempdir()
+        try:
+            fd = os.open(temp_dir, o_tmpfile | os.O_RDWR, 0o600)
+        except OSError as e:
+            if e.errno not in _O_TMPFILE_UNSUPPORTED:
+                raise
+            # Filesystem or kernel without O_TMPFILE support
+            _o_tmpfile_usable = False
+            return None
+        
+        try:
+            # Write errors (ENOSPC, EIO, ...) are real failures and propagate
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            
+            # Give the anonymous inode a name; retry on the (unlikely) name clash
+            for _ in range(tempfile.TMP_MAX):
+                temp_path = os.path.join(temp_dir, f"tmp{os.urandom(6).hex()}{suffix}")
+                try:
+                    os.link(f"/proc/self/fd/{fd}", temp_path)
+                    return temp_path
+                except FileExistsError:
+                    continue
+                except OSError:
+                    # e.g. /proc not mounted or linking refused: let the caller use NamedTemporaryFile
+                    _o_tmpfile_usable = False
+                    return None
+            raise FileExistsError("No usable temporary file name found")
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def validate_path(file_path: str) -> Dict[str, Any]:
         """
         Validate file path and return information.
         
@@ -330,14 +683,21 @@ class FileUtils:
         """
         path = Path(file_path)
         
+        # One stat call provides existence, type and size together
+        try:
+            st = path.stat()
+        except (OSError, ValueError):
+            st = None
+        exists = st is not None
+        
         return {
-            'exists': path.exists(),
-            'is_file': path.is_file() if path.exists() else False,
-            'is_directory': path.is_dir() if path.exists() else False,
+            'exists': exists,
+            'is_file': exists and stat.S_ISREG(st.st_mode),
+            'is_directory': exists and stat.S_ISDIR(st.st_mode),
             'is_absolute': path.is_absolute(),
             'suffix': path.suffix,
             'parent_exists': path.parent.exists(),
-            'size': self.get_file_size(file_path) if path.exists() else 0,
-            'readable': os.access(path, os.R_OK) if path.exists() else False,
-            'writable': os.access(path, os.W_OK) if path.exists() else False
-        } 
\ No newline at end of file
+            'size': st.st_size if exists else 0,
+            'readable': os.access(path, os.R_OK) if exists else False,
+            'writable': os.access(path, os.W_OK) if exists else False
+        }
\ No newline at end of file
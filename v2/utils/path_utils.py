@@ -5,9 +5,13 @@ Ensures compatibility between Windows and macOS/Linux
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Union, List, Optional
 
+# Characters that are invalid in Windows filenames, each mapped to an underscore
+_INVALID_FILENAME_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
 
 def normalize_path(path: Union[str, Path]) -> Path:
     """
@@ -74,16 +78,9 @@ def get_valid_filename(filename: str) -> str:
     Returns:
         Valid filename
     """
-    # Characters that are invalid in Windows filenames
-    invalid_chars = '<>:"/\\|?*'
-    
-    # Replace invalid characters with underscores
-    valid_filename = filename
-    for char in invalid_chars:
-        valid_filename = valid_filename.replace(char, '_')
-    
-    # Remove leading/trailing spaces and dots
-    valid_filename = valid_filename.strip(' .')
+    # Replace invalid characters with underscores in a single pass,
+    # then remove leading/trailing spaces and dots
+    valid_filename = filename.translate(_INVALID_FILENAME_TABLE).strip(' .')
     
     # Ensure filename is not empty
     if not valid_filename:
@@ -98,6 +95,7 @@ def get_valid_filename(filename: str) -> str:
     return valid_filename
 
 
+@lru_cache(maxsize=1)
 def get_temp_dir() -> Path:
     """
     Get a cross-platform temporary directory
@@ -109,6 +107,7 @@ def get_temp_dir() -> Path:
     return Path(tempfile.gettempdir())
 
 
+@lru_cache(maxsize=1)
 def get_home_dir() -> Path:
     """
     Get user's home directory in a cross-platform way
@@ -119,6 +118,7 @@ def get_home_dir() -> Path:
     return Path.home()
 
 
+@lru_cache(maxsize=1)
 def get_desktop_dir() -> Optional[Path]:
     """
     Get user's desktop directory if it exists
@@ -139,6 +139,7 @@ def get_desktop_dir() -> Optional[Path]:
     return None
 
 
+@lru_cache(maxsize=1)
 def get_documents_dir() -> Optional[Path]:
     """
     Get user's documents directory if it exists
@@ -171,9 +172,8 @@ def is_safe_path(path: Union[str, Path], base_dir: Optional[Union[str, Path]] =
         True if path is safe, False otherwise
     """
     try:
-        normalized_path = normalize_path(path)
-        
         if base_dir:
+            normalized_path = normalize_path(path)
             base_normalized = normalize_path(base_dir)
             # Check if the path is within the base directory
             try:
@@ -182,9 +182,11 @@ def is_safe_path(path: Union[str, Path], base_dir: Optional[Union[str, Path]] =
             except ValueError:
                 return False
         
-        # Basic safety check - no parent directory traversal
-        path_str = str(normalized_path)
-        return '..' not in path_str and not path_str.startswith('/')
+        # Basic safety check - no anchored (absolute, rooted or drive) paths and no parent traversal.
+        # This has to look at the path as given: resolving it would already have
+        # folded any '..' away.
+        candidate = Path(path)
+        return not candidate.anchor and '..' not in candidate.parts
         
     except (OSError, ValueError):
         return False
@@ -223,15 +225,20 @@ def list_files_by_extension(directory: Union[str, Path],
         return []
     
     # Normalize extensions to lowercase
-    extensions = [ext.lower() if ext.startswith('.') else f'.{ext.lower()}' 
-                 for ext in extensions]
+    extensions = frozenset(ext.lower() if ext.startswith('.') else f'.{ext.lower()}' 
+                           for ext in extensions)
     
     matching_files = []
     
     try:
-        for file_path in dir_path.iterdir():
-            if file_path.is_file() and get_file_extension(file_path) in extensions:
-                matching_files.append(file_path)
+        # scandir's cached entry type avoids a stat per file; only kept entries become Paths
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                name = entry.name
+                dot = name.rfind('.')
+                # Same rule as Path.suffix: no suffix for dotfiles or a trailing dot
+                if 0 < dot < len(name) - 1 and name[dot:].lower() in extensions and entry.is_file():
+                    matching_files.append(Path(entry.path))
     except (OSError, PermissionError):
         pass
     
@@ -239,18 +246,24 @@ def list_files_by_extension(directory: Union[str, Path],
 
 
 # Platform-specific utilities
+@lru_cache(maxsize=1)
+def _platform_info_items() -> tuple:
+    """Platform details as an immutable tuple of (key, value) pairs, computed once."""
+    return (
+        ('system', sys.platform),
+        ('is_windows', sys.platform.startswith('win')),
+        ('is_macos', sys.platform == 'darwin'),
+        ('is_linux', sys.platform.startswith('linux')),
+        ('path_separator', os.sep),
+        ('path_list_separator', os.pathsep),
+    )
+
+
 def get_platform_info() -> dict:
     """
     Get platform information
     
     Returns:
-        Dictionary with platform details
+        Dictionary with platform details (a fresh copy on every call)
     """
-    return {
-        'system': sys.platform,
-        'is_windows': sys.platform.startswith('win'),
-        'is_macos': sys.platform == 'darwin',
-        'is_linux': sys.platform.startswith('linux'),
-        'path_separator': os.sep,
-        'path_list_separator': os.pathsep
-    } 
\ No newline at end of file
+    return dict(_platform_info_items())
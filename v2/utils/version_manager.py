@@ -3,10 +3,40 @@ Version management for resume profiles.
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Optional, Tuple
 import re
 
+
+def _is_timestamp_digits(version_clean: str) -> bool:
+    """Cheap shape check for the 12-digit YYYYMMDDHHMM part of a version."""
+    return len(version_clean) == 12 and version_clean.isdigit()
+
+
+@lru_cache(maxsize=1024)
+def _parse_version(version_string: str) -> Optional[datetime]:
+    """
+    Parse a version string into its timestamp, memoized across calls.
+    
+    Args:
+        version_string: Version string (e.g., "v202401011200")
+        
+    Returns:
+        Datetime object if parsing successful, None otherwise
+    """
+    # Remove 'v' prefix if present
+    version_clean = version_string.lstrip('v')
+    
+    # Parse timestamp (format: YYYYMMDDHHMM)
+    if not _is_timestamp_digits(version_clean):
+        return None
+    try:
+        return datetime.strptime(version_clean, '%Y%m%d%H%M')
+    except ValueError:
+        return None
+
+
 class VersionManager:
     """Manages versioning for resume profiles."""
     
@@ -30,6 +60,19 @@ class VersionManager:
         self.logger.info(f"Generated version: {version}")
         return version
     
+    def create_version_with_timestamp(self, format_string: str = "%Y-%m-%d %H:%M") -> Tuple[str, str]:
+        """
+        Generate a new version string and a formatted timestamp from one clock read.
+        
+        Args:
+            format_string: Format for the timestamp (default: "%Y-%m-%d %H:%M")
+            
+        Returns:
+            Tuple of (version string, formatted timestamp)
+        """
+        now = datetime.now()
+        return self.generate_version(now), now.strftime(format_string)
+    
     def parse_version(self, version_string: str) -> Optional[datetime]:
         """
         Parse version string to extract timestamp.
@@ -40,21 +83,10 @@ class VersionManager:
         Returns:
             Datetime object if parsing successful, None otherwise
         """
-        try:
-            # Remove 'v' prefix if present
-            version_clean = version_string.lstrip('v')
-            
-            # Parse timestamp (format: YYYYMMDDHHMM)
-            if len(version_clean) == 12 and version_clean.isdigit():
-                timestamp = datetime.strptime(version_clean, '%Y%m%d%H%M')
-                return timestamp
-            else:
-                self.logger.warning(f"Invalid version format: {version_string}")
-                return None
-                
-        except ValueError as e:
-            self.logger.error(f"Error parsing version {version_string}: {str(e)}")
-            return None
+        timestamp = _parse_version(version_string)
+        if timestamp is None:
+            self.logger.warning(f"Invalid version format: {version_string}")
+        return timestamp
     
     def compare_versions(self, version1: str, version2: str) -> int:
         """
@@ -98,6 +130,11 @@ class VersionManager:
             Sorted list of version strings
         """
         try:
+            # Fast path: for well-formed v{YYYYMMDDHHMM} strings the fixed-width
+            # digits sort lexicographically in chronological order, so skip strptime
+            if all(_is_timestamp_digits(version.lstrip('v')) for version in versions):
+                return sorted(versions, key=lambda version: version.lstrip('v'), reverse=reverse)
+            
             # Parse timestamps for sorting
             version_pairs = []
             for version in versions:
@@ -131,8 +168,9 @@ class VersionManager:
         if not versions:
             return None
             
-        sorted_versions = self.sort_versions(versions, reverse=True)
-        return sorted_versions[0]
+        # Only the newest entry is needed: one O(N) scan instead of a full sort.
+        # Unparseable versions rank lowest, as in sort_versions.
+        return max(versions, key=lambda version: _parse_version(version) or datetime.min)
     
     def is_valid_version(self, version_string: str) -> bool:
         """
@@ -198,17 +236,17 @@ class VersionManager:
         if not current_versions:
             return self.generate_version()
             
-        # Get latest existing version
+        # Get latest existing version (single max() pass over cached parses)
         latest_version = self.get_latest_version(current_versions)
         if not latest_version:
             return self.generate_version()
             
-        latest_timestamp = self.parse_version(latest_version)
+        latest_timestamp = _parse_version(latest_version)
         current_time = datetime.now()
         
         # Ensure new version is at least 1 minute newer
         if latest_timestamp and current_time <= latest_timestamp:
-            new_timestamp = latest_timestamp.replace(minute=latest_timestamp.minute + 1)
+            new_timestamp = latest_timestamp + timedelta(minutes=1)
             return self.generate_version(new_timestamp)
         else:
             return self.generate_version(current_time)
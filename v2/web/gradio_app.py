@@ -3,14 +3,35 @@ Gradio Web Interface for EasyCV
 Provides an easy-to-use web interface for resume generation
 """
 
-import gradio as gr
+import io
 import os
 import sys
 import tempfile
 import shutil
 import json
+import re
+import hashlib
+import heapq
+import importlib
+import importlib.util
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any, TYPE_CHECKING
+
+import jinja2
+
+# gradio 及其依赖（fastapi、pydantic 等）导入较慢，只在创建界面时才导入
+if TYPE_CHECKING:
+    import gradio as gr
+
+# orjson 可选：metadata.json 序列化更快，缺失时回退到标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Ensure the parent directory is in the Python path
 current_dir = Path(__file__).parent
@@ -20,10 +41,10 @@ if str(parent_dir) not in sys.path:
 
 # Import modules with error handling
 try:
-    from core.document_parser import DocumentParser
-    from core.ai_processor import AIProcessor
-    from core.template_engine import TemplateEngine
-    from core.output_generator import OutputGenerator
+    # 核心模块（文档解析 / AI / 模板 / 输出）较重，只检查是否存在，
+    # 实际导入推迟到首次使用时（见 EasyCVGradioApp 的惰性属性）
+    if importlib.util.find_spec("core") is None:
+        raise ImportError("No module named 'core'")
     from utils.file_utils import FileUtils
     from utils.version_manager import VersionManager
     from utils.path_utils import (
@@ -73,6 +94,9 @@ except ImportError as e:
         
         def parse_document(self, path):
             return f"测试内容来自: {Path(path).name}"
+        
+        def parse_document_fast(self, path):
+            return self.parse_document(path)
     
     class AIProcessor:
         def __init__(self, config): 
@@ -89,12 +113,15 @@ except ImportError as e:
             }
     
     class TemplateEngine:
+        # {{key}} 占位符，类加载时编译一次
+        _PATTERN = re.compile(r"\{\{(\w+)\}\}")
+        
         def apply_template(self, template, data): 
-            # 简单的模板替换
-            result = template
-            for key, value in data.items():
-                result = result.replace(f"{{{{{key}}}}}", str(value))
-            return result
+            # 简单的模板替换：一次扫描替换全部占位符，未知键原样保留
+            return self._PATTERN.sub(
+                lambda m: str(data[m.group(1)]) if m.group(1) in data else m.group(0),
+                template
+            )
     
     class OutputGenerator:
         def __init__(self, config): 
@@ -105,7 +132,9 @@ except ImportError as e:
             print(f"网站已生成到: {dir_path}")
     
     class FileUtils:
-        pass
+        @staticmethod
+        def copy_file(source_path, destination_path):
+            return shutil.copy2(source_path, destination_path)
     
     class VersionManager:
         def generate_version(self): 
@@ -114,6 +143,10 @@ except ImportError as e:
         def get_timestamp(self): 
             from datetime import datetime
             return datetime.now().strftime('%Y-%m-%d %H:%M')
+        def create_version_with_timestamp(self): 
+            from datetime import datetime
+            now = datetime.now()
+            return now.strftime('%Y%m%d%H%M'), now.strftime('%Y-%m-%d %H:%M')
     
     class ConfigManager:
         def __init__(self):
@@ -142,17 +175,25 @@ except ImportError as e:
                 'temperature': self.get('ai_temperature')
             }
     
+    # 进程内不变，缓存首次结果
+    @lru_cache(maxsize=1)
     def get_temp_dir(): 
         return Path(tempfile.gettempdir())
     
-    def get_platform_info(): 
+    @lru_cache(maxsize=1)
+    def _platform_info_items(): 
         import platform
-        return {
-            "system": platform.system().lower(),
-            "is_windows": platform.system() == "Windows",
-            "is_macos": platform.system() == "Darwin",
-            "path_separator": os.sep
-        }
+        system = platform.system()
+        return (
+            ("system", system.lower()),
+            ("is_windows", system == "Windows"),
+            ("is_macos", system == "Darwin"),
+            ("path_separator", os.sep),
+        )
+    
+    def get_platform_info(): 
+        # 缓存不可变的元组，每次返回新的字典，调用方修改不会影响后续结果
+        return dict(_platform_info_items())
     
     def normalize_path(p): 
         return Path(p).resolve()
@@ -165,11 +206,162 @@ except ImportError as e:
         path.mkdir(parents=True, exist_ok=True)
         return path
     
+    # 不安全字符 -> 下划线 的转换表，只构建一次
+    _INVALID_FILENAME_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+    
     def get_valid_filename(name): 
-        import re
-        # 移除不安全字符
-        safe_name = re.sub(r'[<>:"/\\|?*]', '_', name)
-        return safe_name.strip(' .')
+        # 移除不安全字符（单次 str.translate）
+        return name.translate(_INVALID_FILENAME_TABLE).strip(' .')
+
+
+def _dumps(obj: Any) -> bytes:
+    """将对象序列化为缩进 2 格的 UTF-8 JSON 字节（优先使用 orjson）"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _file_digest(path: Path) -> str:
+    """分块计算文件的 BLAKE2b（128 位）摘要，不把整个文件读入内存"""
+    with open(path, 'rb') as fp:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(fp, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+        
+        h = hashlib.blake2b(digest_size=16)
+        buffer = memoryview(bytearray(1 << 20))
+        while n := fp.readinto(buffer):
+            h.update(buffer[:n])
+        return h.hexdigest()
+
+
+def _user_cache_dir() -> Path:
+    """当前用户的 EasyCV 缓存目录（遵循 XDG_CACHE_HOME，默认 ~/.cache/easycv）"""
+    base = os.environ.get('XDG_CACHE_HOME')
+    return (Path(base) if base else Path.home() / ".cache") / "easycv"
+
+
+def _core_class(module_name: str, class_name: str):
+    """按需导入核心模块中的类；受限模式下返回本文件定义的后备类"""
+    if CORE_MODULES_AVAILABLE:
+        return getattr(importlib.import_module(module_name), class_name)
+    return globals()[class_name]
+
+
+# 简历各段落：(字段, 段落格式)，按输出顺序排列；默认模板与回退格式都由此生成
+_RESUME_SECTIONS = (
+    ('name', '# {}'),
+    ('contact', '## 联系信息\n{}'),
+    ('summary', '## 个人简介\n{}'),
+    ('experience', '## 工作经验\n{}'),
+    ('education', '## 教育背景\n{}'),
+    ('skills', '## 技能\n{}'),
+    ('projects', '## 项目经验\n{}'),
+)
+
+# 默认简历模板（{{variable}} 占位符由 TemplateEngine 替换）
+_DEFAULT_TEMPLATE = "\n\n".join(
+    heading.format("{{" + key + "}}") for key, heading in _RESUME_SECTIONS
+) + "\n"
+
+# 模板失败时的回退格式（Jinja2）：只输出 resume_data 中存在的段落，段落间空一行
+_FALLBACK_TEMPLATE_JINJA = "{%- set ns = namespace(sep='') -%}" + "".join(
+    "{%- if '" + key + "' in resume %}{{ ns.sep }}"
+    + heading.format("{{ resume['" + key + "'] }}")
+    + "{% set ns.sep = '\\n\\n' %}{% endif -%}"
+    for key, heading in _RESUME_SECTIONS
+)
+
+# Markdown 输出的打开方式：覆盖写入；Windows 下需 O_BINARY 避免换行被转换
+_MD_OPEN_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_CLOEXEC', 0)
+)
+
+# 解析结果缓存：条目最长保留时间（秒）与最大条目数
+PARSE_CACHE_MAX_AGE = 7 * 24 * 3600
+PARSE_CACHE_MAX_ENTRIES = 200
+
+# 上传文件摘要缓存的最大条目数（超出后整体清空）
+DIGEST_CACHE_SIZE = 256
+
+# 档案列表缓存有效期（秒），避免连续点击刷新时重复扫描目录
+PROFILES_CACHE_TTL = 2.0
+
+# 请求队列：同时处理的请求数（按 CPU 核数，至少 4）与最大排队数（多用户时生成请求不再互相阻塞）
+QUEUE_CONCURRENCY = max(4, os.cpu_count() or 1)
+QUEUE_MAX_SIZE = 32
+
+# 界面中的静态样式与说明文字：导入时构建一次，每次创建界面直接复用
+_INTERFACE_CSS = """
+.gradio-container {
+    max-width: 1200px !important;
+}
+.file-upload {
+    border: 2px dashed #ccc;
+    border-radius: 10px;
+    text-align: center;
+    padding: 20px;
+}
+"""
+
+_INTRO_MARKDOWN = """
+# 🚀 EasyCV - AI驱动的简历生成器
+
+欢迎使用EasyCV！这是一个智能简历生成工具，可以帮助您：
+- 📄 上传现有简历、项目文档等资料
+- 🎯 根据目标职位描述优化内容
+- 📝 生成多种格式的专业简历（Markdown、Word、HTML）
+- 🎨 应用专业模板和样式
+
+**支持的文件格式:** PDF, DOCX, Markdown (.md), 纯文本 (.txt)
+"""
+
+_LIMITED_MODE_MARKDOWN = """
+⚠️ **警告**: 部分核心模块未正确加载，某些功能可能无法正常工作。
+💡 请确保所有依赖已正确安装并检查环境设置。
+"""
+
+_USAGE_TIPS_MARKDOWN = """
+### 💡 使用提示
+
+1. **文件组织**: 生成的文件保存在 `profiles/` 目录下
+2. **版本管理**: 每次生成会创建新版本（格式：v202401011200）
+3. **跨平台**: 支持 Windows 和 macOS
+4. **文件格式**: 
+   - **Markdown**: 易于编辑和版本控制
+   - **Word**: 可直接打印或邮件发送
+   - **HTML**: 响应式网站，可部署到 GitHub Pages
+"""
+
+_ENV_HELP_MARKDOWN = f"""
+### 📋 环境变量设置
+
+为了使用AI功能，您需要设置以下环境变量：
+
+```bash
+# 必需 - OpenAI API密钥
+export OPENAI_API_KEY="your-api-key-here"
+
+# 可选配置
+export EASYCV_OUTPUT_DIR="custom_output_directory" 
+export EASYCV_AI_MODEL="gpt-4"
+export EASYCV_LOG_LEVEL="INFO"
+```
+
+### 🔧 Python版本信息
+
+- Python版本: {sys.version}
+- 核心模块加载: {'✅ 正常' if CORE_MODULES_AVAILABLE else '❌ 部分失败'}
+
+### 🔧 高级功能
+
+如需更多控制和批处理功能，请使用命令行界面：
+
+```bash
+cd v2
+python main.py generate --help
+```
+"""
 
 
 class EasyCVGradioApp:
@@ -185,61 +377,111 @@ class EasyCVGradioApp:
             
         self.config_manager = ConfigManager()
         self.temp_dir = get_temp_dir() / "easycv_temp"
-        create_safe_directory(self.temp_dir)
+        self.temp_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize components
-        self.document_parser = DocumentParser(verbose=True)
-        
-        # Initialize AI processor with proper configuration
-        try:
-            # Try to get API key from config or environment
-            api_key = None
-            if hasattr(self.config_manager, 'get_ai_config'):
-                ai_config = self.config_manager.get_ai_config()
-                api_key = ai_config.get('openai_api_key') if ai_config else None
-            
-            # Fallback to environment variable
-            if not api_key:
-                import os
-                api_key = os.getenv('OPENAI_API_KEY')
-            
-            if api_key:
-                self.ai_processor = AIProcessor(api_key=api_key)
-                print("✅ 成功初始化AI处理器（使用OpenAI API）")
-            else:
-                print("⚠️  未找到OpenAI API密钥，使用测试AI处理器")
-                # Use fallback AIProcessor from the import failure section
-                raise ImportError("No API key available")
-                
-        except Exception as e:
-            print(f"⚠️  AI处理器初始化失败: {e}")
-            print("🔄 使用测试AI处理器...")
-            # Use the fallback AIProcessor class defined above
-            class TestAIProcessor:
-                def __init__(self, config): 
-                    pass
-                def generate_resume_content(self, **kwargs): 
-                    return {
-                        "name": "测试用户",
-                        "contact": "email: test@example.com\n电话: 123-456-7890",
-                        "summary": "这是一个测试生成的个人简介。",
-                        "experience": "测试工作经验内容。",
-                        "education": "测试教育背景。",
-                        "skills": "Python, JavaScript, 机器学习",
-                        "projects": "测试项目经验。",
-                        "certifications": "相关认证证书",
-                        "achievements": "主要成就奖项"
-                    }
-            self.ai_processor = TestAIProcessor(self.config_manager)
+        # 解析结果缓存：按文件内容哈希保存，重复上传同一文件时不再重新解析。
+        # 内容含个人信息，放在当前用户的缓存目录下并仅限本人访问，启动时清理过期条目
+        self.parse_cache_dir = _user_cache_dir() / "parse_cache"
+        self.parse_cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        os.chmod(self.parse_cache_dir, 0o700)
+        self._prune_parse_cache()
+        # 文件摘要缓存：(路径, 大小, 修改时间) -> 摘要；同一上传文件反复生成时无需重新计算哈希
+        self._digest_cache: Dict[Tuple[str, int, int], str] = {}
         
-        self.template_engine = TemplateEngine()
-        self.output_generator = OutputGenerator(self.config_manager.get('output_dir', 'profiles'))
+        # 核心组件在首次使用时才创建（见下方惰性属性），加快界面启动
+        self._document_parser = None
+        self._ai_processor = None
+        self._template_engine = None
+        self._output_generator = None
         self.file_utils = FileUtils()
         self.version_manager = VersionManager()
         
-        # Platform info
+        # Platform info（get_platform_info 已缓存；展示文本也只格式化一次）
         self.platform_info = get_platform_info()
+        self._platform_info_text = (
+            f"系统: {self.platform_info['system']}\n"
+            f"Windows: {self.platform_info['is_windows']}\n"
+            f"macOS: {self.platform_info['is_macos']}\n"
+            f"路径分隔符: {self.platform_info['path_separator']}"
+        )
+        
+        # list_existing_profiles 的缓存：(生成时间, 各档案目录修改时间, 文本)
+        self._profiles_cache = (0.0, None, "")
+        
+        # 回退模板只编译一次，之后每次直接渲染
+        self._fallback_template = jinja2.Environment(loader=jinja2.BaseLoader()).from_string(_FALLBACK_TEMPLATE_JINJA)
+        
+    @property
+    def document_parser(self):
+        """文档解析器（首次访问时创建）"""
+        if self._document_parser is None:
+            self._document_parser = _core_class("core.document_parser", "DocumentParser")(verbose=True)
+        return self._document_parser
+    
+    @property
+    def ai_processor(self):
+        """AI处理器（首次访问时创建；无 API 密钥或初始化失败时使用测试处理器）"""
+        if self._ai_processor is None:
+            # Initialize AI processor with proper configuration
+            try:
+                # Try to get API key from config or environment
+                api_key = None
+                if hasattr(self.config_manager, 'get_ai_config'):
+                    ai_config = self.config_manager.get_ai_config()
+                    api_key = ai_config.get('openai_api_key') if ai_config else None
+            
+                # Fallback to environment variable
+                if not api_key:
+                    import os
+                    api_key = os.getenv('OPENAI_API_KEY')
+            
+                if api_key:
+                    self._ai_processor = _core_class("core.ai_processor", "AIProcessor")(api_key=api_key)
+                    print("✅ 成功初始化AI处理器（使用OpenAI API）")
+                else:
+                    print("⚠️  未找到OpenAI API密钥，使用测试AI处理器")
+                    # Use fallback AIProcessor from the import failure section
+                    raise ImportError("No API key available")
+            
+            except Exception as e:
+                print(f"⚠️  AI处理器初始化失败: {e}")
+                print("🔄 使用测试AI处理器...")
+                # Use the fallback AIProcessor class defined above
+                class TestAIProcessor:
+                    def __init__(self, config): 
+                        pass
+                    def generate_resume_content(self, **kwargs): 
+                        return {
+                            "name": "测试用户",
+                            "contact": "email: test@example.com\n电话: 123-456-7890",
+                            "summary": "这是一个测试生成的个人简介。",
+                            "experience": "测试工作经验内容。",
+                            "education": "测试教育背景。",
+                            "skills": "Python, JavaScript, 机器学习",
+                            "projects": "测试项目经验。",
+                            "certifications": "相关认证证书",
+                            "achievements": "主要成就奖项"
+                        }
+                self._ai_processor = TestAIProcessor(self.config_manager)
         
+        return self._ai_processor
+    
+    @property
+    def template_engine(self):
+        """模板引擎（首次访问时创建）"""
+        if self._template_engine is None:
+            self._template_engine = _core_class("core.template_engine", "TemplateEngine")()
+        return self._template_engine
+    
+    @property
+    def output_generator(self):
+        """输出生成器（首次访问时创建）"""
+        if self._output_generator is None:
+            self._output_generator = _core_class("core.output_generator", "OutputGenerator")(
+                self.config_manager.get('output_dir', 'profiles')
+            )
+        return self._output_generator
+    
     def process_uploaded_files(self, files: List[Any]) -> Tuple[str, str]:
         """
         Process uploaded files and extract content
@@ -254,34 +496,56 @@ class EasyCVGradioApp:
             return "❌ 请至少上传一个文件", ""
             
         try:
-            all_content = []
+            # 各文件内容直接写入同一缓冲区，最后一次性取出
+            all_content = io.StringIO()
             processed_files = []
             
             # Store file info for later saving
             self.uploaded_files_info = []
             
-            for file in files:
-                if file is None:
-                    continue
-                    
-                # Get file path
-                file_path = Path(file.name)
-                
+            # Get file paths（字符串路径只取一次，后续直接复用）
+            file_names = [os.fspath(file.name) for file in files if file is not None]
+            file_paths = [Path(name) for name in file_names]
+            
+            for file_name, file_path in zip(file_names, file_paths):
                 # Store file information for later saving
                 file_info = {
-                    'original_path': str(file_path),
+                    'original_path': file_name,
                     'name': file_path.name,
                     'size': file_path.stat().st_size if file_path.exists() else 0,
                     'extension': file_path.suffix.lower()
                 }
                 self.uploaded_files_info.append(file_info)
-                
-                # Parse document with detailed console output
+            
+            # 各文件解析互不依赖：多文件时并行解析（map 保持上传顺序），
+            # 线程数不超过 CPU 核数；单个文件失败只跳过该文件，不影响其余文件
+            def parse(file_name: str):
+                try:
+                    return self._parsed_text(Path(file_name))
+                except Exception as e:
+                    return e
+            
+            if len(file_names) > 1:
+                workers = min(len(file_names), os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    contents = list(executor.map(parse, file_names))
+            else:
+                contents = [parse(file_name) for file_name in file_names]
+            
+            for file_path, content in zip(file_paths, contents):
+                # Detailed console output per parsed document
                 print(f"\n🔍 处理上传文件: {file_path.name}")
-                content = self.document_parser.parse_document(str(file_path))
                 
-                if content.strip():
-                    all_content.append(f"=== {file_path.name} ===\n{content}\n")
+                if isinstance(content, Exception):
+                    print(f"❌ 文件 {file_path.name} 解析失败: {content}\n")
+                elif content.strip():
+                    if processed_files:
+                        all_content.write('\n')  # 文件之间空一行
+                    all_content.write('=== ')
+                    all_content.write(file_path.name)
+                    all_content.write(' ===\n')
+                    all_content.write(content)
+                    all_content.write('\n')
                     processed_files.append(file_path.name)
                     
                     # 在控制台显示提取的完整内容
@@ -293,10 +557,10 @@ class EasyCVGradioApp:
                 else:
                     print(f"⚠️  警告: 从 {file_path.name} 未提取到任何内容\n")
                     
-            if not all_content:
+            if not processed_files:
                 return "❌ 无法从上传的文件中提取内容", ""
                 
-            extracted_text = "\n".join(all_content)
+            extracted_text = all_content.getvalue()
             success_msg = f"✅ 成功处理 {len(processed_files)} 个文件: {', '.join(processed_files)}"
             
             return success_msg, extracted_text
@@ -327,7 +591,7 @@ class EasyCVGradioApp:
                 file_path = Path(file.name)
                 
                 # 创建详细解析器（启用调试模式）
-                detail_parser = DocumentParser(verbose=False)  # 不在这里输出控制台信息
+                detail_parser = _core_class("core.document_parser", "DocumentParser")(verbose=False)  # 不在这里输出控制台信息
                 
                 print(f"\n🔍 详细解析文件: {file_path.name}")
                 content = detail_parser.extract_text_from_file(str(file_path))
@@ -408,36 +672,40 @@ class EasyCVGradioApp:
             print(f"📝 档案名称: {profile_name}")
             print(f"🎯 目标语言: {language}")
             print(f"📊 输入参数验证:")
-            print(f"  - 档案名称: {'✅' if profile_name.strip() else '❌'}")
-            print(f"  - 职位描述: {'✅' if job_description.strip() else '❌'}")  
-            print(f"  - 提取内容: {'✅' if extracted_content.strip() else '❌'}")
+            # 用 isspace() 判断空白，避免 strip() 为每个输入复制一份字符串
+            has_profile_name = bool(profile_name) and not profile_name.isspace()
+            has_job_description = bool(job_description) and not job_description.isspace()
+            has_extracted_content = bool(extracted_content) and not extracted_content.isspace()
+            print(f"  - 档案名称: {'✅' if has_profile_name else '❌'}")
+            print(f"  - 职位描述: {'✅' if has_job_description else '❌'}")  
+            print(f"  - 提取内容: {'✅' if has_extracted_content else '❌'}")
             
-            if not profile_name.strip():
+            if not has_profile_name:
                 return "❌ 请输入个人档案名称", None, None, None
                 
-            if not job_description.strip():
+            if not has_job_description:
                 return "❌ 请输入工作描述", None, None, None
                 
-            if not extracted_content.strip():
+            if not has_extracted_content:
                 return "❌ 请先上传并处理文档", None, None, None
             
             # Clean profile name
             safe_profile_name = get_valid_filename(profile_name.strip())
             
             # Create version
-            version = self.version_manager.generate_version()
+            # 版本号与时间戳来自同一次取时，文件名前缀也只拼接一次
+            version, timestamp = self.version_manager.create_version_with_timestamp()
+            base_name = f"{safe_profile_name}.v{version}"
             
-            # Create output directory
-            output_dir = create_safe_directory(
-                safe_join("profiles", safe_profile_name, f"v{version}")
-            )
+            # Create output directory（safe_join 已解析为绝对路径，直接 mkdir 即可）
+            output_dir = safe_join("profiles", safe_profile_name, f"v{version}")
+            output_dir.mkdir(parents=True, exist_ok=True)
             
             # Process style reference if provided
             style_content = ""
             if style_reference is not None:
                 try:
-                    style_path = Path(style_reference.name)
-                    style_content = self.document_parser.parse_document(str(style_path))
+                    style_content = self._parsed_text(Path(style_reference.name))
                 except Exception as e:
                     print(f"Warning: Could not process style reference: {e}")
             
@@ -457,7 +725,7 @@ class EasyCVGradioApp:
             print(f"✅ AI生成的简历数据键: {list(resume_data.keys()) if resume_data else 'None'}")
             
             # Apply template
-            if template_content.strip():
+            if template_content and not template_content.isspace():
                 try:
                     print(f"📝 应用自定义模板...")
                     final_content = self.template_engine.apply_template(
@@ -499,63 +767,86 @@ class EasyCVGradioApp:
             output_formats = normalized_formats
             print(f"🔍 标准化后的输出格式: {output_formats}")
             
-            # Generate markdown
-            if 'markdown' in output_formats:
-                md_path = output_dir / f"{safe_profile_name}.v{version}.md"
-                print(f"📄 生成Markdown文件: {md_path}")
+            # 三种输出格式互不依赖：并行生成，总耗时取决于最慢的一种
+            def write_markdown() -> Optional[str]:
+                md_path = output_dir / f"{base_name}.md"
+                md_path_s = os.fspath(md_path)
+                print(f"📄 生成Markdown文件: {md_path_s}")
                 try:
-                    with open(md_path, 'w', encoding='utf-8') as f:
-                        f.write(final_content)
-                    print(f"✅ Markdown文件写入成功，文件大小: {md_path.stat().st_size} 字节")
-                    output_files['markdown'] = str(md_path)
+                    # 一次编码后直接写入文件描述符，跳过 TextIOWrapper/BufferedWriter 层
+                    data = memoryview(final_content.encode('utf-8'))
+                    fd = os.open(md_path_s, _MD_OPEN_FLAGS, 0o644)
+                    try:
+                        written = 0
+                        while written < len(data):
+                            written += os.write(fd, data[written:])
+                    finally:
+                        os.close(fd)
+                    print(f"✅ Markdown文件写入成功，文件大小: {len(data)} 字节")
+                    return md_path_s
                 except Exception as e:
                     print(f"❌ Markdown文件写入失败: {e}")
-            else:
-                print(f"⏭️  跳过Markdown生成（不在输出格式中）")
+                    return None
             
-            # Generate Word document
-            if 'word' in output_formats:
-                word_path = output_dir / f"{safe_profile_name}.v{version}.docx"
-                print(f"📋 生成Word文档: {word_path}")
+            def write_word() -> Optional[str]:
+                word_path = output_dir / f"{base_name}.docx"
+                word_path_s = os.fspath(word_path)
+                print(f"📋 生成Word文档: {word_path_s}")
                 try:
-                    self.output_generator.generate_word(final_content, str(word_path))
+                    self.output_generator.generate_word(final_content, word_path_s)
                     if word_path.exists():
                         print(f"✅ Word文档生成成功，文件大小: {word_path.stat().st_size} 字节")
-                        output_files['word'] = str(word_path)
-                    else:
-                        print(f"❌ Word文档生成失败：文件不存在")
+                        return word_path_s
+                    print(f"❌ Word文档生成失败：文件不存在")
                 except Exception as e:
                     print(f"❌ Word generation failed: {e}")
-                    # 不设置word键，这样get()会返回默认值
-            else:
-                print(f"⏭️  跳过Word生成（不在输出格式中）")
+                # 不设置word键，这样get()会返回默认值
+                return None
             
-            # Generate HTML website
-            if 'html' in output_formats:
-                html_path = output_dir / f"{safe_profile_name}.v{version}.html"
-                print(f"🌐 生成HTML网站: {html_path}")
+            def write_html() -> Optional[str]:
+                html_path = output_dir / f"{base_name}.html"
+                html_path_s = os.fspath(html_path)
+                print(f"🌐 生成HTML网站: {html_path_s}")
                 try:
                     self.output_generator.generate_website(
                         final_content, 
-                        str(output_dir),
-                        f"{safe_profile_name}.v{version}"
+                        os.fspath(output_dir),
+                        base_name
                     )
                     if html_path.exists():
                         print(f"✅ HTML网站生成成功，文件大小: {html_path.stat().st_size} 字节")
-                        output_files['html'] = str(html_path)
-                    else:
-                        print(f"❌ HTML网站生成失败：文件不存在")
+                        return html_path_s
+                    print(f"❌ HTML网站生成失败：文件不存在")
                 except Exception as e:
                     print(f"❌ HTML generation failed: {e}")
-                    # 不设置html键，这样get()会返回默认值
-            else:
-                print(f"⏭️  跳过HTML生成（不在输出格式中）")
+                # 不设置html键，这样get()会返回默认值
+                return None
+            
+            writers = {
+                'markdown': (write_markdown, "⏭️  跳过Markdown生成（不在输出格式中）"),
+                'word': (write_word, "⏭️  跳过Word生成（不在输出格式中）"),
+                'html': (write_html, "⏭️  跳过HTML生成（不在输出格式中）"),
+            }
+            
+            with ThreadPoolExecutor(max_workers=len(writers)) as executor:
+                futures = {}
+                for key, (writer, skip_msg) in writers.items():
+                    if key in output_formats:
+                        futures[key] = executor.submit(writer)
+                    else:
+                        print(skip_msg)
+                
+                # 按 markdown / word / html 的固定顺序收集结果
+                for key, future in futures.items():
+                    generated_path = future.result()
+                    if generated_path:
+                        output_files[key] = generated_path
             
             # Save original documents if available
             source_docs_info = []
             if hasattr(self, 'uploaded_files_info') and self.uploaded_files_info:
                 source_docs_dir = output_dir / "source_documents"
-                create_safe_directory(source_docs_dir)
+                source_docs_dir.mkdir(exist_ok=True)
                 
                 for file_info in self.uploaded_files_info:
                     original_path = Path(file_info['original_path'])
@@ -565,12 +856,11 @@ class EasyCVGradioApp:
                         saved_path = source_docs_dir / saved_filename
                         
                         try:
-                            import shutil
-                            shutil.copy2(str(original_path), str(saved_path))
+                            self._save_source_document(original_path, saved_path)
                             
                             # Update file info with saved location
                             file_info['saved_path'] = str(saved_path.relative_to(output_dir))
-                            file_info['saved_at'] = self.version_manager.get_timestamp()
+                            file_info['saved_at'] = timestamp
                             source_docs_info.append(file_info)
                             
                         except Exception as e:
@@ -580,7 +870,7 @@ class EasyCVGradioApp:
             metadata = {
                 'profile_name': safe_profile_name,
                 'version': version,
-                'timestamp': self.version_manager.get_timestamp(),
+                'timestamp': timestamp,
                 'job_description': job_description,
                 'output_formats': output_formats,
                 'platform': self.platform_info,
@@ -590,8 +880,7 @@ class EasyCVGradioApp:
             }
             
             metadata_path = output_dir / "metadata.json"
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            metadata_path.write_bytes(_dumps(metadata))
             
             print(f"\n📁 生成的文件汇总:")
             for format_name, file_path in output_files.items():
@@ -600,6 +889,9 @@ class EasyCVGradioApp:
                 else:
                     print(f"  ❌ {format_name}: 未生成")
             
+            # 新版本已写入，下次列出档案时重新扫描
+            self._profiles_cache = (0.0, None, "")
+            
             success_msg = f"✅ 简历生成成功！\n档案: {safe_profile_name}\n版本: v{version}\n输出目录: {output_dir}"
             
             # 确保文件路径存在，不存在则返回None而不是空字符串
@@ -633,41 +925,114 @@ class EasyCVGradioApp:
         except Exception as e:
             return f"❌ 生成简历时出错: {str(e)}", None, None, None
     
-    def _format_resume_data(self, resume_data: Dict[str, Any]) -> str:
+    def _parsed_text(self, path: Path) -> str:
         """
-        Format resume data into markdown when template fails
+        Parse a document, reusing the cached text of an identical earlier upload
         
         Args:
-            resume_data: Dictionary containing resume data
+            path: Document to parse
             
         Returns:
-            Formatted markdown content
+            Extracted text content
         """
-        sections = []
-        
-        # Header
-        if 'name' in resume_data:
-            sections.append(f"# {resume_data['name']}")
-        
-        if 'contact' in resume_data:
-            sections.append(f"## 联系信息\n{resume_data['contact']}")
+        st = path.stat()
+        digest_key = (os.fspath(path), st.st_size, st.st_mtime_ns)
+        digest = self._digest_cache.get(digest_key)
+        if digest is None:
+            digest = _file_digest(path)
+            if len(self._digest_cache) >= DIGEST_CACHE_SIZE:
+                self._digest_cache.clear()
+            self._digest_cache[digest_key] = digest
+        # 键中包含解析后端，安装/卸载 PyMuPDF、mammoth 等之后不会继续返回旧解析结果
+        backend = getattr(self.document_parser, 'backend_signature', lambda: "fallback")()
+        cache_file = self.parse_cache_dir / f"{digest}-{backend}{path.suffix.lower()}.txt"
         
-        if 'summary' in resume_data:
-            sections.append(f"## 个人简介\n{resume_data['summary']}")
+        try:
+            text = cache_file.read_bytes().decode('utf-8')
+        except FileNotFoundError:
+            pass
+        except (OSError, UnicodeDecodeError):
+            # 缓存文件损坏（截断或非 UTF-8）时删除并重新解析
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
+        else:
+            # 命中时刷新修改时间，清理按最近使用保留条目
+            try:
+                os.utime(cache_file)
+            except OSError:
+                pass
+            return text
         
-        if 'experience' in resume_data:
-            sections.append(f"## 工作经验\n{resume_data['experience']}")
+        text = self.document_parser.parse_document_fast(os.fspath(path))
+        # 先写临时文件再原子替换，并发解析同一文件时不会读到半截缓存
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_file.write_bytes(text.encode('utf-8'))
+        os.replace(tmp_file, cache_file)
+        return text
+    
+    def _prune_parse_cache(self) -> None:
+        """删除超过 PARSE_CACHE_MAX_AGE 的缓存条目，并只保留最近使用的 PARSE_CACHE_MAX_ENTRIES 个"""
+        cutoff = time.time() - PARSE_CACHE_MAX_AGE
+        entries = []
+        try:
+            with os.scandir(self.parse_cache_dir) as it:
+                for entry in it:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    mtime = entry.stat(follow_symlinks=False).st_mtime
+                    if mtime < cutoff:
+                        entries.append((mtime, entry.path, True))
+                    elif entry.name.endswith('.txt'):
+                        entries.append((mtime, entry.path, False))
+        except OSError:
+            return
         
-        if 'education' in resume_data:
-            sections.append(f"## 教育背景\n{resume_data['education']}")
+        expired = [path for _, path, is_expired in entries if is_expired]
+        live = sorted((item for item in entries if not item[2]), reverse=True)
+        expired.extend(path for _, path, _ in live[PARSE_CACHE_MAX_ENTRIES:])
+        for path in expired:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+    
+    def _save_source_document(self, source: Path, destination: Path) -> None:
+        """
+        Persist an uploaded source document next to the generated resume
         
-        if 'skills' in resume_data:
-            sections.append(f"## 技能\n{resume_data['skills']}")
+        Args:
+            source: Uploaded file (usually in Gradio's temp directory)
+            destination: Target path inside the profile's source_documents folder
+        """
+        # 同一分钟内重复生成会复用版本目录：目标已是源文件的硬链接时无需再做任何事，
+        # 否则先删除旧文件（绝不能对同一 inode 做复制，否则会把源文件截断为空）
+        if os.path.lexists(destination):
+            if os.path.samefile(source, destination):
+                return
+            os.unlink(destination)
         
-        if 'projects' in resume_data:
-            sections.append(f"## 项目经验\n{resume_data['projects']}")
+        # 同一文件系统上直接硬链接，不复制任何数据
+        try:
+            os.link(source, destination)
+            return
+        except OSError:
+            pass
+        # 跨文件系统或不支持硬链接时，交给 FileUtils 做内核级复制
+        self.file_utils.copy_file(str(source), str(destination))
+    
+    def _format_resume_data(self, resume_data: Dict[str, Any]) -> str:
+        """
+        Format resume data into markdown when template fails
         
-        return "\n\n".join(sections)
+        Args:
+            resume_data: Dictionary containing resume data
+            
+        Returns:
+            Formatted markdown content
+        """
+        return self._fallback_template.render(resume=resume_data)
     
     def list_existing_profiles(self) -> str:
         """
@@ -676,27 +1041,47 @@ class EasyCVGradioApp:
         Returns:
             Formatted string of existing profiles
         """
+        # 短时间内的重复刷新直接复用上次结果
+        cached_at, cached_signature, cached_text = self._profiles_cache
+        if cached_text and time.monotonic() - cached_at < PROFILES_CACHE_TTL:
+            return cached_text
+        
         try:
-            profiles_dir = Path("profiles")
-            if not profiles_dir.exists():
+            if not os.path.isdir("profiles"):
                 return "📁 暂无现有档案"
             
+            # os.scandir 的目录项自带类型信息，无需逐项 stat
+            with os.scandir("profiles") as profile_entries:
+                profile_dirs = [
+                    (entry.name, entry.path, entry.stat(follow_symlinks=False).st_mtime_ns)
+                    for entry in profile_entries
+                    if entry.is_dir(follow_symlinks=False)
+                ]
+            
+            # 新增或删除版本会更新档案目录的修改时间；都未变化时无需逐个扫描版本目录
+            signature = tuple((name, mtime) for name, _, mtime in profile_dirs)
+            if cached_text and signature == cached_signature:
+                self._profiles_cache = (time.monotonic(), signature, cached_text)
+                return cached_text
+            
             profiles = []
-            for profile_dir in profiles_dir.iterdir():
-                if profile_dir.is_dir():
-                    versions = []
-                    for version_dir in profile_dir.iterdir():
-                        if version_dir.is_dir() and version_dir.name.startswith('v'):
-                            versions.append(version_dir.name)
-                    
-                    if versions:
-                        versions.sort(reverse=True)  # Latest first
-                        profiles.append(f"📋 **{profile_dir.name}**\n   版本: {', '.join(versions[:3])}")
+            for profile_name, profile_path, _ in profile_dirs:
+                with os.scandir(profile_path) as version_entries:
+                    versions = [
+                        entry.name for entry in version_entries
+                        if entry.is_dir(follow_symlinks=False) and entry.name.startswith('v')
+                    ]
+                
+                if versions:
+                    latest = heapq.nlargest(3, versions)  # Latest first
+                    profiles.append(f"📋 **{profile_name}**\n   版本: {', '.join(latest)}")
             
             if not profiles:
                 return "📁 暂无现有档案"
             
-            return "📁 **现有档案:**\n\n" + "\n\n".join(profiles)
+            result = "📁 **现有档案:**\n\n" + "\n\n".join(profiles)
+            self._profiles_cache = (time.monotonic(), signature, result)
+            return result
             
         except Exception as e:
             return f"❌ 获取档案列表时出错: {str(e)}"
@@ -708,68 +1093,27 @@ class EasyCVGradioApp:
         Returns:
             Default template content
         """
-        default_template = """# {{name}}
-
-## 联系信息
-{{contact}}
-
-## 个人简介
-{{summary}}
-
-## 工作经验
-{{experience}}
-
-## 教育背景
-{{education}}
-
-## 技能
-{{skills}}
-
-## 项目经验
-{{projects}}
-"""
-        return default_template
+        return _DEFAULT_TEMPLATE
     
-    def create_interface(self) -> gr.Blocks:
+    def create_interface(self) -> "gr.Blocks":
         """
         Create the Gradio interface
         
         Returns:
             Gradio Blocks interface
         """
+        import gradio as gr
+        
         with gr.Blocks(
             title="EasyCV - AI简历生成器",
             theme=gr.themes.Soft(),
-            css="""
-            .gradio-container {
-                max-width: 1200px !important;
-            }
-            .file-upload {
-                border: 2px dashed #ccc;
-                border-radius: 10px;
-                text-align: center;
-                padding: 20px;
-            }
-            """
+            css=_INTERFACE_CSS
         ) as interface:
             
-            gr.Markdown("""
-            # 🚀 EasyCV - AI驱动的简历生成器
-            
-            欢迎使用EasyCV！这是一个智能简历生成工具，可以帮助您：
-            - 📄 上传现有简历、项目文档等资料
-            - 🎯 根据目标职位描述优化内容
-            - 📝 生成多种格式的专业简历（Markdown、Word、HTML）
-            - 🎨 应用专业模板和样式
-            
-            **支持的文件格式:** PDF, DOCX, Markdown (.md), 纯文本 (.txt)
-            """)
+            gr.Markdown(_INTRO_MARKDOWN)
             
             if not CORE_MODULES_AVAILABLE:
-                gr.Markdown("""
-                ⚠️ **警告**: 部分核心模块未正确加载，某些功能可能无法正常工作。
-                💡 请确保所有依赖已正确安装并检查环境设置。
-                """)
+                gr.Markdown(_LIMITED_MODE_MARKDOWN)
             
             with gr.Tabs():
                 # Tab 1: Generate New Resume
@@ -869,22 +1213,12 @@ class EasyCVGradioApp:
                     refresh_btn = gr.Button("🔄 刷新档案列表", variant="secondary")
                     profiles_list = gr.Textbox(
                         label="档案列表",
-                        value=lambda: self.list_existing_profiles(),
+                        value=self.list_existing_profiles,
                         lines=10,
                         interactive=False
                     )
                     
-                    gr.Markdown("""
-                    ### 💡 使用提示
-                    
-                    1. **文件组织**: 生成的文件保存在 `profiles/` 目录下
-                    2. **版本管理**: 每次生成会创建新版本（格式：v202401011200）
-                    3. **跨平台**: 支持 Windows 和 macOS
-                    4. **文件格式**: 
-                       - **Markdown**: 易于编辑和版本控制
-                       - **Word**: 可直接打印或邮件发送
-                       - **HTML**: 响应式网站，可部署到 GitHub Pages
-                    """)
+                    gr.Markdown(_USAGE_TIPS_MARKDOWN)
                 
                 # Tab 3: Configuration
                 with gr.Tab("⚙️ 设置"):
@@ -892,42 +1226,11 @@ class EasyCVGradioApp:
                     
                     platform_info = gr.Textbox(
                         label="平台信息",
-                        value=lambda: f"系统: {self.platform_info['system']}\n"
-                                     f"Windows: {self.platform_info['is_windows']}\n"
-                                     f"macOS: {self.platform_info['is_macos']}\n"
-                                     f"路径分隔符: {self.platform_info['path_separator']}",
+                        value=self._platform_info_text,
                         interactive=False
                     )
                     
-                    gr.Markdown(f"""
-                    ### 📋 环境变量设置
-                    
-                    为了使用AI功能，您需要设置以下环境变量：
-                    
-                    ```bash
-                    # 必需 - OpenAI API密钥
-                    export OPENAI_API_KEY="your-api-key-here"
-                    
-                    # 可选配置
-                    export EASYCV_OUTPUT_DIR="custom_output_directory" 
-                    export EASYCV_AI_MODEL="gpt-4"
-                    export EASYCV_LOG_LEVEL="INFO"
-                    ```
-                    
-                    ### 🔧 Python版本信息
-                    
-                    - Python版本: {sys.version}
-                    - 核心模块加载: {'✅ 正常' if CORE_MODULES_AVAILABLE else '❌ 部分失败'}
-                    
-                    ### 🔧 高级功能
-                    
-                    如需更多控制和批处理功能，请使用命令行界面：
-                    
-                    ```bash
-                    cd v2
-                    python main.py generate --help
-                    ```
-                    """)
+                    gr.Markdown(_ENV_HELP_MARKDOWN)
             
             # Event handlers
             file_process_btn.click(
@@ -999,6 +1302,12 @@ class EasyCVGradioApp:
 🔍 正在自动寻找可用端口...
         """)
         
+        # 启用队列：由工作线程池处理事件，排满后新请求直接被拒绝
+        interface.queue(
+            concurrency_count=QUEUE_CONCURRENCY,
+            max_size=QUEUE_MAX_SIZE,
+            api_open=False
+        )
         interface.launch(**launch_args)
 
     def convert_language_choice(self, choice: str) -> str: